@@ -1,37 +1,540 @@
-import streamlit as st
+import time
+_LOAD_STARTED = time.perf_counter()
+
+import sys
+
+# `python mojo.py worker` never draws any UI, so it doesn't import Streamlit
+WORKER_MODE = __name__ == '__main__' and sys.argv[1:2] == ['worker']
+if not WORKER_MODE:
+    import streamlit as st
+
 import pandas as pd
+import numpy as np
 import requests
 from bs4 import BeautifulSoup
-import time
+import random
 import json
 from datetime import datetime
 from urllib.parse import urlparse, urljoin
 import re
-from typing import List, Dict, Optional
+from typing import List, Dict, Optional, Callable, Iterator, Tuple, Union
 import io
+import os
+import importlib
+import importlib.util
+import socket
+import argparse
+import functools
+import sqlite3
+import uuid
+from contextlib import closing
+import soupsieve
+from concurrent.futures import ThreadPoolExecutor
+
+
+# Optional subsystems are only located here; they are imported on first use
+# so app reruns and workers don't pay for what they never touch
+def _has_module(name: str) -> bool:
+    return importlib.util.find_spec(name) is not None
+
+
+def process_resource(func):
+    """st.cache_resource in the app; a plain once-per-process memo in workers"""
+    if WORKER_MODE:
+        return functools.lru_cache(maxsize=None)(func)
+    return st.cache_resource(func)
+
+
+@process_resource
+def get_import_timings() -> Dict[str, float]:
+    """Seconds spent importing each lazily loaded module, kept for the life of the process"""
+    return {}
+
+
+# Shared across reruns, which re-execute this file but never re-import a module
+IMPORT_TIMINGS = get_import_timings()
+
+
+def lazy_import(name: str):
+    """Import a module on first use and record how long it took"""
+    module = sys.modules.get(name)
+    if module is None:
+        started = time.perf_counter()
+        module = importlib.import_module(name)
+        IMPORT_TIMINGS[name] = time.perf_counter() - started
+    return module
 
 
 # For JavaScript-rendered content
+SELENIUM_AVAILABLE = _has_module('selenium')
+
+# For HTTP/2 fetching (httpx needs h2 for http2=True)
+HTTPX_AVAILABLE = _has_module('httpx') and _has_module('h2')
+
+# For spilling large results to memory-mapped files
+ARROW_AVAILABLE = _has_module('pyarrow')
+
+
+# Faster JSON decoding for JSON-LD (optional)
 try:
-    from selenium import webdriver
-    from selenium.webdriver.chrome.options import Options
-    from selenium.webdriver.common.by import By
-    from selenium.webdriver.support.ui import WebDriverWait
-    from selenium.webdriver.support import expected_conditions as EC
-    SELENIUM_AVAILABLE = True
+    import orjson
+    _json_loads = orjson.loads
 except ImportError:
-    SELENIUM_AVAILABLE = False
+    _json_loads = json.loads
 
 
-# For scheduling
-from apscheduler.schedulers.background import BackgroundScheduler
 import threading
 
 
-# For data visualization
-import plotly.express as px
-import plotly.graph_objects as go
+# Compiled CSS selectors / regexes are shared across pages and scrapes
+_SELECTOR_CACHE = {}
+_REGEX_CACHE = {}
+
+
+def compile_selector(selector: str):
+    """Compile a CSS selector once and reuse it across pages"""
+    compiled = _SELECTOR_CACHE.get(selector)
+    if compiled is None:
+        compiled = soupsieve.compile(selector)
+        _SELECTOR_CACHE[selector] = compiled
+    return compiled
+
+
+def compile_regex(pattern: str):
+    """Compile a post-processing regex once and reuse it across pages"""
+    compiled = _REGEX_CACHE.get(pattern)
+    if compiled is None:
+        compiled = re.compile(pattern)
+        _REGEX_CACHE[pattern] = compiled
+    return compiled
+
 
+def compile_schema(fields: Dict[str, Dict]) -> List[tuple]:
+    """
+    Compile a record schema into (name, selector, attr, regex) tuples.
+    
+    Each field spec is a dict with an optional 'selector' (relative to the
+    container, empty means the container itself), an optional 'attr'
+    ('text' by default, 'html' for inner markup, or any attribute name)
+    and an optional 'regex' applied to the extracted value.
+    """
+    compiled = []
+    for name, spec in fields.items():
+        if isinstance(spec, str):
+            spec = {'selector': spec}
+        selector = spec.get('selector') or None
+        regex = spec.get('regex') or None
+        compiled.append((
+            name,
+            compile_selector(selector) if selector else None,
+            spec.get('attr', 'text'),
+            compile_regex(regex) if regex else None
+        ))
+    return compiled
+
+
+class RejectedResponse(requests.exceptions.RequestException):
+    """Response aborted before download finished (too large or not HTML)"""
+
+
+class CircuitOpenError(requests.exceptions.RequestException):
+    """Host has been failing and is temporarily skipped"""
+
+
+class HostBusyError(requests.exceptions.RequestException):
+    """No connection slot on the host freed up in time"""
+
+
+class RetryPolicy:
+    """Exponential backoff with full jitter and a per-host retry budget"""
+    
+    def __init__(self, max_attempts: int = 3, base_delay: float = 0.5, max_delay: float = 10.0,
+                 budget_ratio: float = 0.2, budget_cap: float = 10.0):
+        self.max_attempts = max_attempts
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+        # Each success earns budget_ratio retry tokens, each retry spends one
+        self.budget_ratio = budget_ratio
+        self.budget_cap = budget_cap
+    
+    def backoff(self, attempt: int, retry_after: float = None) -> float:
+        """Seconds to wait before the given retry attempt (1-based)"""
+        delay = random.uniform(0, min(self.max_delay, self.base_delay * 2 ** attempt))
+        if retry_after is not None:
+            delay = max(delay, min(retry_after, self.max_delay))
+        return delay
+    
+    @staticmethod
+    def is_retryable(error: Exception) -> bool:
+        """Connection problems, timeouts, 429 and 5xx are worth retrying"""
+        if isinstance(error, (CircuitOpenError, HostBusyError, RejectedResponse)):
+            return False
+        if isinstance(error, requests.exceptions.HTTPError):
+            status = error.response.status_code if error.response is not None else 0
+            return status == 429 or status >= 500
+        return isinstance(error, (
+            requests.exceptions.ConnectionError,
+            requests.exceptions.Timeout,
+            requests.exceptions.ChunkedEncodingError
+        ))
+    
+    @staticmethod
+    def retry_after(error: Exception) -> Optional[float]:
+        """Seconds from a Retry-After header, if the server sent one"""
+        response = getattr(error, 'response', None)
+        value = response.headers.get('Retry-After') if response is not None else None
+        return float(value) if value and value.isdigit() else None
+
+
+class HostHealth:
+    """
+    Per-host circuit breaker and adaptive concurrency limit.
+    
+    A host that fails FAILURE_THRESHOLD times in a row is skipped for
+    COOLDOWN_SECONDS, then a single probe request decides whether it is
+    back. Concurrency per host grows additively while requests succeed at
+    normal latency and halves on errors or latency spikes.
+    """
+    
+    FAILURE_THRESHOLD = 5
+    COOLDOWN_SECONDS = 30
+    INITIAL_LIMIT = 4
+    MAX_LIMIT = 16
+    SLOT_TIMEOUT = 60
+    
+    def __init__(self, policy: RetryPolicy = None):
+        self.policy = policy or RetryPolicy()
+        self._cond = threading.Condition()
+        self.hosts = {}
+    
+    def _state(self, host: str) -> Dict:
+        return self.hosts.setdefault(host, {
+            'failures': 0,
+            'opened_at': None,
+            'probing': False,
+            'latency': None,
+            'error_rate': 0.0,
+            'limit': float(self.INITIAL_LIMIT),
+            'in_flight': 0,
+            'retry_tokens': self.policy.budget_cap
+        })
+    
+    def acquire(self, host: str):
+        """Wait for a request slot on this host, or fail fast if its circuit is open"""
+        with self._cond:
+            state = self._state(host)
+            if state['opened_at'] is not None:
+                if time.monotonic() - state['opened_at'] < self.COOLDOWN_SECONDS or state['probing']:
+                    raise CircuitOpenError(f"{host} is failing, skipping for now")
+                # Cooldown over - let exactly one probe through
+                state['probing'] = True
+            
+            has_slot = self._cond.wait_for(
+                lambda: state['in_flight'] < max(1, int(state['limit'])),
+                timeout=self.SLOT_TIMEOUT
+            )
+            if not has_slot:
+                state['probing'] = False
+                raise HostBusyError(
+                    f"{host} is busy: no connection slot freed up within {self.SLOT_TIMEOUT}s"
+                )
+            state['in_flight'] += 1
+    
+    def release(self, host: str, healthy: bool, latency: float):
+        """Record the outcome of a request and adjust the host's limits"""
+        with self._cond:
+            state = self._state(host)
+            state['in_flight'] -= 1
+            state['error_rate'] = 0.8 * state['error_rate'] + 0.2 * (0.0 if healthy else 1.0)
+            
+            if healthy:
+                baseline = state['latency']
+                state['latency'] = latency if baseline is None else 0.8 * baseline + 0.2 * latency
+                state['failures'] = 0
+                state['opened_at'] = None
+                state['probing'] = False
+                state['retry_tokens'] = min(self.policy.budget_cap,
+                                            state['retry_tokens'] + self.policy.budget_ratio)
+                if baseline is not None and latency > 2 * baseline:
+                    state['limit'] = max(1.0, state['limit'] / 2)
+                else:
+                    state['limit'] = min(float(self.MAX_LIMIT), state['limit'] + 1 / state['limit'])
+            else:
+                state['failures'] += 1
+                state['limit'] = max(1.0, state['limit'] / 2)
+                if state['probing'] or state['failures'] >= self.FAILURE_THRESHOLD:
+                    state['opened_at'] = time.monotonic()
+                    state['probing'] = False
+            
+            self._cond.notify_all()
+    
+    def try_spend_retry(self, host: str) -> bool:
+        """Take one retry token from the host's budget"""
+        with self._cond:
+            state = self._state(host)
+            if state['retry_tokens'] >= 1:
+                state['retry_tokens'] -= 1
+                return True
+            return False
+    
+    def summary(self) -> pd.DataFrame:
+        """Current per-host state, for display"""
+        with self._cond:
+            return pd.DataFrame([
+                {
+                    'host': host,
+                    'circuit': 'open' if state['opened_at'] is not None else 'closed',
+                    'limit': int(state['limit']),
+                    'in_flight': state['in_flight'],
+                    'latency_s': round(state['latency'], 3) if state['latency'] is not None else None,
+                    'error_rate': round(state['error_rate'], 3)
+                }
+                for host, state in self.hosts.items()
+            ])
+
+# Content types worth downloading and parsing
+HTML_CONTENT_TYPES = ('text/html', 'application/xhtml+xml', 'text/xml', 'application/xml', 'text/plain')
+
+_META_CHARSET = re.compile(
+    rb'''<meta[^>]+charset\s*=\s*["']?\s*([a-zA-Z0-9_:.\-]+)''',
+    re.IGNORECASE
+)
+
+
+def detect_charset(content_type: str, head: bytes) -> Optional[str]:
+    """Pick the charset once: BOM, then HTTP header, then a <meta> scan of the first bytes"""
+    if head.startswith(b'\xef\xbb\xbf'):
+        return 'utf-8-sig'
+    if head.startswith((b'\xff\xfe', b'\xfe\xff')):
+        return 'utf-16'
+    
+    match = re.search(r'charset\s*=\s*["\']?([^\s;"\']+)', content_type or '', re.IGNORECASE)
+    if match:
+        return match.group(1)
+    
+    match = _META_CHARSET.search(head[:4096])
+    if match:
+        return match.group(1).decode('ascii')
+    return None
+
+
+def decode_html(content: bytes, charset: Optional[str]) -> str:
+    """Decode with the detected charset, falling back to UTF-8 then windows-1252"""
+    for encoding in (charset, 'utf-8'):
+        if not encoding:
+            continue
+        try:
+            return content.decode(encoding)
+        except (LookupError, UnicodeDecodeError):
+            continue
+    return content.decode('windows-1252', errors='replace')
+
+
+def check_response_headers(content_type: str, content_length: Optional[str], max_bytes: int):
+    """Reject a response from its headers alone, before reading the body"""
+    mime = (content_type or '').split(';')[0].strip().lower()
+    if mime and mime not in HTML_CONTENT_TYPES:
+        raise RejectedResponse(f"Not an HTML page (Content-Type: {mime})")
+    
+    if content_length and content_length.isdigit() and int(content_length) > max_bytes:
+        raise RejectedResponse(f"Page too large ({int(content_length):,} bytes, limit {max_bytes:,})")
+
+
+def read_capped(chunks, max_bytes: int) -> bytes:
+    """Join decoded body chunks, aborting once they exceed max_bytes"""
+    body = []
+    received = 0
+    for chunk in chunks:
+        received += len(chunk)
+        if received > max_bytes:
+            raise RejectedResponse(f"Page exceeded the {max_bytes:,} byte limit")
+        body.append(chunk)
+    return b''.join(body)
+
+
+class RequestsTransport:
+    """
+    HTTP/1.1 transport on a requests.Session (one connection per concurrent request).
+    
+    Accept-Encoding comes from urllib3: br with brotli, zstd with backports.zstd
+    (compression.zstd on Python 3.14+).
+    """
+    
+    name = 'requests'
+    
+    def __init__(self):
+        self.session = requests.Session()
+    
+    def fetch(self, url: str, headers: Dict, timeout: float, max_bytes: int) -> Tuple[str, bytes]:
+        """GET url and return (content_type, decoded body)"""
+        with self.session.get(
+            url, 
+            headers=headers, 
+            timeout=timeout,
+            allow_redirects=True,
+            stream=True
+        ) as response:
+            response.raise_for_status()
+            content_type = response.headers.get('Content-Type', '')
+            check_response_headers(content_type, response.headers.get('Content-Length'), max_bytes)
+            return content_type, read_capped(response.iter_content(chunk_size=64 * 1024), max_bytes)
+    
+    def close(self):
+        self.session.close()
+
+
+class Http2Transport:
+    """
+    HTTP/2 transport on httpx, multiplexing concurrent requests to one origin.
+    
+    The client runs on a background event loop (one per process, from
+    get_transport_loop()), so blocking callers on any thread can share one
+    connection per origin. Errors are mapped to requests exceptions so
+    retries and circuit breaking work unchanged. Accept-Encoding comes from
+    httpx: br with brotli, zstd with zstandard.
+    """
+    
+    name = 'http2'
+    
+    def __init__(self, verify: bool = True, loop=None):
+        if not HTTPX_AVAILABLE:
+            raise ImportError("The HTTP/2 transport needs httpx and h2 (pip install 'httpx[http2]')")
+        self.verify = verify
+        self.loop = loop or get_transport_loop()
+        self.client = None
+    
+    async def _fetch(self, url: str, headers: Dict, timeout: float, max_bytes: int) -> Tuple[str, bytes]:
+        httpx = lazy_import('httpx')
+        
+        # Created on the loop thread, which is the only place it is ever used
+        if self.client is None:
+            self.client = httpx.AsyncClient(http2=True, follow_redirects=True, verify=self.verify)
+        
+        try:
+            async with self.client.stream('GET', url, headers=headers, timeout=timeout) as response:
+                if response.status_code >= 400:
+                    shim = requests.Response()
+                    shim.status_code = response.status_code
+                    shim.headers = requests.structures.CaseInsensitiveDict(response.headers)
+                    shim.url = str(response.url)
+                    raise requests.exceptions.HTTPError(
+                        f"{response.status_code} Error for url: {response.url}", response=shim
+                    )
+                
+                content_type = response.headers.get('Content-Type', '')
+                check_response_headers(content_type, response.headers.get('Content-Length'), max_bytes)
+                
+                body = []
+                received = 0
+                async for chunk in response.aiter_bytes(64 * 1024):
+                    received += len(chunk)
+                    if received > max_bytes:
+                        raise RejectedResponse(f"Page exceeded the {max_bytes:,} byte limit")
+                    body.append(chunk)
+                return content_type, b''.join(body)
+        except httpx.TimeoutException as e:
+            raise requests.exceptions.Timeout(f"{url}: {e!r}")
+        except httpx.UnsupportedProtocol as e:
+            # A bad or missing scheme fails at once, as it does with requests
+            raise requests.exceptions.InvalidSchema(f"{url}: {e}")
+        except httpx.TransportError as e:
+            raise requests.exceptions.ConnectionError(f"{url}: {e!r}")
+        except httpx.TooManyRedirects as e:
+            raise requests.exceptions.TooManyRedirects(f"{url}: {e}")
+        except httpx.DecodingError as e:
+            raise requests.exceptions.ContentDecodingError(f"{url}: {e}")
+        except httpx.RequestError as e:
+            raise requests.exceptions.RequestException(f"{url}: {e!r}")
+        except httpx.InvalidURL as e:
+            raise requests.exceptions.InvalidURL(f"{url}: {e}")
+    
+    def fetch(self, url: str, headers: Dict, timeout: float, max_bytes: int) -> Tuple[str, bytes]:
+        """GET url and return (content_type, decoded body)"""
+        future = lazy_import('asyncio').run_coroutine_threadsafe(
+            self._fetch(url, headers, timeout, max_bytes), self.loop
+        )
+        return future.result()
+    
+    def close(self):
+        if self.client is not None:
+            lazy_import('asyncio').run_coroutine_threadsafe(self.client.aclose(), self.loop).result()
+            self.client = None
+
+
+TRANSPORTS = {
+    'requests': RequestsTransport,
+    'http2': Http2Transport
+}
+
+
+def _add_property(item: Dict, name: str, value):
+    """Set a property, turning repeated properties into lists"""
+    if name not in item:
+        item[name] = value
+    elif isinstance(item[name], list):
+        item[name].append(value)
+    else:
+        item[name] = [item[name], value]
+
+
+def _microdata_value(element) -> str:
+    """Value of a microdata itemprop element, per the HTML spec"""
+    name = element.name
+    if name == 'meta':
+        return element.get('content', '')
+    if name in ('a', 'area', 'link'):
+        return element.get('href', '')
+    if name in ('img', 'audio', 'video', 'source', 'iframe', 'embed', 'track'):
+        return element.get('src', '')
+    if name == 'object':
+        return element.get('data', '')
+    if name == 'time' and element.get('datetime'):
+        return element['datetime']
+    if name in ('data', 'meter') and element.get('value') is not None:
+        return element['value']
+    return element.get_text(strip=True)
+
+
+def _flatten_entity(entity: Dict, prefix: str = '') -> Dict:
+    """Flatten nested dicts to dotted columns; lists become ' | '-joined text or JSON"""
+    flat = {}
+    for key, value in entity.items():
+        column = f"{prefix}{key}"
+        if isinstance(value, dict):
+            flat.update(_flatten_entity(value, column + '.'))
+        elif isinstance(value, list):
+            if all(not isinstance(v, (dict, list)) for v in value):
+                flat[column] = ' | '.join(str(v) for v in value)
+            else:
+                flat[column] = json.dumps(value, default=str)
+        else:
+            flat[column] = value
+    return flat
+
+
+def iter_structured_entities(structured: Dict) -> Iterator[Dict]:
+    """Yield one flat record per entity, unpacking JSON-LD @graph arrays as it goes"""
+    for doc in structured.get('json-ld', []):
+        if not isinstance(doc, dict):
+            continue
+        graph = doc.get('@graph')
+        nodes = graph if isinstance(graph, list) else [doc]
+        for node in nodes:
+            if isinstance(node, dict):
+                yield {'@format': 'json-ld', **_flatten_entity({k: v for k, v in node.items() if k != '@context'})}
+    
+    for fmt in ('microdata', 'rdfa'):
+        for item in structured.get(fmt, []):
+            yield {'@format': fmt, **_flatten_entity(item)}
+    
+    for fmt in ('opengraph', 'twitter'):
+        if structured.get(fmt):
+            yield {'@format': fmt, **_flatten_entity(structured[fmt])}
+
+
+def structured_to_frame(structured: Dict) -> pd.DataFrame:
+    """Tidy table of every structured-data entity, one row each"""
+    return pd.DataFrame(list(iter_structured_entities(structured)))
 
 
 class AdvancedWebScraper:
@@ -40,57 +543,98 @@ class AdvancedWebScraper:
     JavaScript handling, and data processing capabilities
     """
     
-    def __init__(self, url: str, use_selenium: bool = False):
+    # Default cap on the decoded response body
+    MAX_RESPONSE_BYTES = 20 * 1024 * 1024
+    
+    def __init__(self, url: str, use_selenium: bool = False, max_bytes: int = None,
+                 transport: Union[str, RequestsTransport, Http2Transport] = 'requests',
+                 host_health: HostHealth = None):
         self.url = url
         self.use_selenium = use_selenium
+        self.max_bytes = max_bytes or self.MAX_RESPONSE_BYTES
+        # Pass a shared registry so circuit state outlives this scraper
+        self.host_health = host_health or HostHealth()
+        # A transport name builds one this scraper owns; an instance is borrowed
+        self.owns_transport = isinstance(transport, str)
+        self.transport = TRANSPORTS[transport]() if self.owns_transport else transport
         self.headers = {
             'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36',
             'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,*/*;q=0.8',
             'Accept-Language': 'en-US,en;q=0.5',
-            'Accept-Encoding': 'gzip, deflate',
+            # No Accept-Encoding: each transport's client advertises only what it can decode
             'Connection': 'keep-alive',
             'Upgrade-Insecure-Requests': '1'
         }
-        self.session = requests.Session()
         self.soup = None
         self.html = None
+        # Set when a fetch fails; quiet scrapers (pool threads) only record it
+        self.last_error = None
+        # HTTP status of the last failed fetch, when the server answered
+        self.last_status = None
+        self.quiet = False
+        # (url, error) for pages a paginated scrape could not fetch
+        self.failed_pages = []
         
+    def _report_error(self, message: str, warning: bool = False):
+        """Remember a fetch error and show it, unless running off the script thread or in a worker"""
+        self.last_error = message
+        if self.quiet or WORKER_MODE:
+            return
+        if warning:
+            st.warning(f"⚠️ {message}")
+        else:
+            st.error(f"❌ {message}")
+    
     def fetch_page_requests(self) -> Optional[str]:
-        """Fetch page using requests (for static content)"""
-        try:
-            response = self.session.get(
-                self.url, 
-                headers=self.headers, 
-                timeout=15,
-                allow_redirects=True
-            )
-            response.raise_for_status()
-            return response.content
-        except requests.exceptions.RequestException as e:
-            st.error(f"❌ Error fetching page: {e}")
-            return None
+        """Fetch page using requests (for static content), retrying transient failures"""
+        host = urlparse(self.url).netloc
+        health = self.host_health
+        policy = health.policy
+        attempt = 0
+        
+        while True:
+            try:
+                health.acquire(host)
+            except requests.exceptions.RequestException as e:
+                self._report_error(f"Error fetching page: {e}")
+                return None
+            
+            started = time.monotonic()
+            healthy = True
+            try:
+                return self._download()
+            except requests.exceptions.RequestException as e:
+                error = e
+                healthy = not RetryPolicy.is_retryable(e)
+            finally:
+                health.release(host, healthy, time.monotonic() - started)
+            
+            attempt += 1
+            if healthy or attempt >= policy.max_attempts or not health.try_spend_retry(host):
+                response = getattr(error, 'response', None)
+                self.last_status = response.status_code if response is not None else None
+                self._report_error(f"Error fetching page: {error}")
+                return None
+            time.sleep(policy.backoff(attempt, RetryPolicy.retry_after(error)))
+    
+    def _download(self) -> str:
+        """Single streamed GET of self.url, decoded to text"""
+        content_type, content = self.transport.fetch(self.url, self.headers, 15, self.max_bytes)
+        return decode_html(content, detect_charset(content_type, content[:4096]))
+    
+    def close(self):
+        """Release the transport's connections (borrowed transports stay open)"""
+        if self.owns_transport:
+            self.transport.close()
     
     def fetch_page_selenium(self) -> Optional[str]:
         """Fetch page using Selenium (for JavaScript-rendered content)"""
         if not SELENIUM_AVAILABLE:
-            st.warning("⚠️ Selenium not available. Install selenium and chromedriver.")
+            self._report_error("Selenium not available. Install selenium and chromedriver.", warning=True)
             return None
         
         try:
-            options = Options()
-            options.add_argument('--headless')
-            options.add_argument('--no-sandbox')
-            options.add_argument('--disable-dev-shm-usage')
-            options.add_argument('--disable-gpu')
-            options.add_argument(f'user-agent={self.headers["User-Agent"]}')
-            
-            driver = webdriver.Chrome(options=options)
-            driver.get(self.url)
-            
-            
-            WebDriverWait(driver, 10).until(
-                EC.presence_of_element_located((By.TAG_NAME, "body"))
-            )
+            driver = self._open_browser()
             
             time.sleep(3)
             
@@ -99,9 +643,137 @@ class AdvancedWebScraper:
             
             return html
         except Exception as e:
-            st.error(f"❌ Selenium error: {e}")
+            self._report_error(f"Selenium error: {e}")
             return None
     
+    def _open_browser(self):
+        """Start headless Chrome on self.url and wait for the body to appear"""
+        webdriver = lazy_import('selenium.webdriver')
+        By = lazy_import('selenium.webdriver.common.by').By
+        WebDriverWait = lazy_import('selenium.webdriver.support.ui').WebDriverWait
+        EC = lazy_import('selenium.webdriver.support.expected_conditions')
+        
+        options = webdriver.ChromeOptions()
+        options.add_argument('--headless')
+        options.add_argument('--no-sandbox')
+        options.add_argument('--disable-dev-shm-usage')
+        options.add_argument('--disable-gpu')
+        options.add_argument(f'user-agent={self.headers["User-Agent"]}')
+        
+        driver = webdriver.Chrome(options=options)
+        driver.get(self.url)
+        
+        
+        WebDriverWait(driver, 10).until(
+            EC.presence_of_element_located((By.TAG_NAME, "body"))
+        )
+        return driver
+    
+    # Returns outerHTML of items not harvested yet, marking them as seen.
+    # Seen nodes live in a WeakSet so the harvested HTML carries no marker.
+    _HARVEST_NEW_ITEMS_JS = """
+        const seen = window.__mojoSeen || (window.__mojoSeen = new WeakSet());
+        const items = Array.from(document.querySelectorAll(arguments[0]))
+            .filter(el => !seen.has(el));
+        items.forEach(el => seen.add(el));
+        return items.map(el => el.outerHTML);
+    """
+    _HARVEST_COUNT_NEW_JS = """
+        const seen = window.__mojoSeen || new WeakSet();
+        return Array.from(document.querySelectorAll(arguments[0]))
+            .filter(el => !seen.has(el)).length;
+    """
+    # Clicks the "load more" control if given, otherwise scrolls to the bottom
+    _HARVEST_ADVANCE_JS = """
+        if (arguments[0]) {
+            const button = document.querySelector(arguments[0]);
+            if (!button) return false;
+            button.scrollIntoView({block: 'center'});
+            button.click();
+            return true;
+        }
+        window.scrollTo(0, document.body.scrollHeight);
+        return true;
+    """
+    
+    def harvest_scroll(self, extractor: Callable[['AdvancedWebScraper'], pd.DataFrame],
+                       item_selector: str, load_more_selector: str = None, max_steps: int = 50,
+                       max_items: int = None, step_timeout: float = 5.0, idle_rounds: int = 2) -> pd.DataFrame:
+        """
+        Scroll (or click "load more") until no new items appear, extracting
+        only the items added since the previous step.
+        
+        Each step pulls just the new items' HTML out of the browser and runs
+        the extractor on that fragment, so the full page source is never
+        re-serialized or re-parsed. If the harvest stops on an error, the
+        rows gathered so far are returned and the error is in self.last_error.
+        """
+        self.last_error = None
+        if not SELENIUM_AVAILABLE:
+            self._report_error("Selenium not available. Install selenium and chromedriver.", warning=True)
+            return pd.DataFrame()
+        
+        WebDriverWait = lazy_import('selenium.webdriver.support.ui').WebDriverWait
+        selenium_exceptions = lazy_import('selenium.common.exceptions')
+        TimeoutException = selenium_exceptions.TimeoutException
+        
+        frames = []
+        seen_rows = set()
+        harvested = 0
+        driver = None
+        try:
+            driver = self._open_browser()
+            idle = 0
+            for step in range(max_steps + 1):
+                fragments = driver.execute_script(self._HARVEST_NEW_ITEMS_JS, item_selector)
+                if fragments:
+                    idle = 0
+                    fragment = self._spawn(self.url)
+                    fragment.html = '\n'.join(fragments)
+                    fragment.soup = BeautifulSoup(fragment.html, 'html.parser')
+                    
+                    df = extractor(fragment)
+                    if df is not None and not df.empty:
+                        # Re-rendered (virtualized) items can come back as new nodes
+                        row_hashes = DataProcessor.hash_rows(df)
+                        is_new = ~row_hashes.isin(seen_rows)
+                        seen_rows.update(row_hashes[is_new])
+                        frames.append(df[is_new.values])
+                    
+                    harvested += len(fragments)
+                    if max_items and harvested >= max_items:
+                        break
+                elif step > 0:
+                    idle += 1
+                    if idle >= idle_rounds:
+                        break
+                
+                if step == max_steps or not driver.execute_script(self._HARVEST_ADVANCE_JS, load_more_selector):
+                    break
+                
+                # Wait for new items instead of sleeping a fixed time
+                try:
+                    WebDriverWait(driver, step_timeout, poll_frequency=0.25).until(
+                        lambda d: d.execute_script(self._HARVEST_COUNT_NEW_JS, item_selector) > 0
+                    )
+                except TimeoutException:
+                    pass
+        except selenium_exceptions.WebDriverException as e:
+            self.last_error = f"Browser error: {e.msg or repr(e)}"
+        except Exception as e:
+            # Extractor or selector failures, reported by the caller with the partial count
+            self.last_error = f"Extraction error: {e!r}"
+        finally:
+            if driver is not None:
+                try:
+                    driver.quit()
+                except selenium_exceptions.WebDriverException:
+                    pass
+        
+        if not frames:
+            return pd.DataFrame()
+        return pd.concat(frames, ignore_index=True)
+    
     def fetch_page(self) -> bool:
         """Main fetch method - chooses between requests and selenium"""
         if self.use_selenium:
@@ -174,19 +846,106 @@ class AdvancedWebScraper:
         
         return pd.DataFrame(data)
     
+    def extract_schema(self, container_selector: str, fields: Dict[str, Dict]) -> pd.DataFrame:
+        """Extract one aligned row per container using named field sub-selectors"""
+        container = compile_selector(container_selector)
+        schema = compile_schema(fields)
+        
+        records = []
+        for element in container.select(self.soup):
+            record = {}
+            for name, selector, attr, regex in schema:
+                target = selector.select_one(element) if selector is not None else element
+                value = None
+                
+                if target is not None:
+                    if attr == 'text':
+                        value = target.get_text(strip=True)
+                    elif attr == 'html':
+                        value = target.decode_contents()
+                    else:
+                        value = target.get(attr)
+                        if isinstance(value, list):
+                            value = ' '.join(value)
+                        if value and attr in ('href', 'src'):
+                            value = urljoin(self.url, value)
+                
+                if value is not None and regex is not None:
+                    match = regex.search(value)
+                    if match:
+                        value = match.group(1) if regex.groups else match.group(0)
+                    else:
+                        value = None
+                
+                record[name] = value
+            records.append(record)
+        
+        return pd.DataFrame(records, columns=[name for name, _, _, _ in schema])
+    
     def extract_structured_data(self) -> Dict:
-        """Extract JSON-LD and schema.org structured data"""
-        structured_data = []
+        """
+        Collect JSON-LD, microdata, RDFa, OpenGraph and Twitter card data
+        in a single walk over the document.
+        """
+        structured = {'json-ld': [], 'microdata': [], 'rdfa': [], 'opengraph': {}, 'twitter': {}}
         
-        # Find JSON-LD scripts
-        for script in self.soup.find_all('script', type='application/ld+json'):
-            try:
-                data = json.loads(script.string)
-                structured_data.append(data)
-            except json.JSONDecodeError:
+        # (node, enclosing microdata item, enclosing RDFa resource), popped in document order
+        stack = [(child, None, None) for child in reversed(self.soup.contents)]
+        while stack:
+            node, md_item, rdfa_item = stack.pop()
+            if not hasattr(node, 'attrs'):
+                continue
+            attrs = node.attrs
+            
+            if node.name == 'script':
+                if attrs.get('type', '').lower() == 'application/ld+json':
+                    try:
+                        data = _json_loads(node.get_text())
+                    except ValueError:
+                        continue
+                    structured['json-ld'].extend(data if isinstance(data, list) else [data])
                 continue
+            
+            if node.name == 'meta':
+                key = attrs.get('property') or attrs.get('name') or ''
+                for prefix in ('og', 'twitter'):
+                    if key.startswith(prefix + ':'):
+                        section = structured['opengraph' if prefix == 'og' else 'twitter']
+                        _add_property(section, key[len(prefix) + 1:], attrs.get('content', ''))
+            
+            child_md, child_rdfa = md_item, rdfa_item
+            
+            # Microdata: itemscope opens an item, itemprop adds to the enclosing one
+            if 'itemscope' in attrs:
+                child_md = {'@type': attrs.get('itemtype', '')}
+                if 'itemprop' in attrs and md_item is not None:
+                    for prop in attrs['itemprop'].split():
+                        _add_property(md_item, prop, child_md)
+                else:
+                    structured['microdata'].append(child_md)
+            elif 'itemprop' in attrs and md_item is not None:
+                for prop in attrs['itemprop'].split():
+                    _add_property(md_item, prop, _microdata_value(node))
+            
+            # RDFa: typeof opens a resource, property adds to the enclosing one
+            if 'typeof' in attrs:
+                child_rdfa = {'@type': attrs['typeof']}
+                if attrs.get('vocab'):
+                    child_rdfa['@vocab'] = attrs['vocab']
+                if 'property' in attrs and rdfa_item is not None:
+                    for prop in attrs['property'].split():
+                        _add_property(rdfa_item, prop, child_rdfa)
+                else:
+                    structured['rdfa'].append(child_rdfa)
+            elif 'property' in attrs and rdfa_item is not None:
+                value = attrs.get('content') or attrs.get('resource') or attrs.get('href') \
+                    or attrs.get('src') or node.get_text(strip=True)
+                for prop in attrs['property'].split():
+                    _add_property(rdfa_item, prop, value)
+            
+            stack.extend((child, child_md, child_rdfa) for child in reversed(node.contents))
         
-        return structured_data
+        return structured
     
     def extract_meta_data(self) -> pd.DataFrame:
         """Extract meta tags information"""
@@ -221,12 +980,249 @@ class AdvancedWebScraper:
                     })
         
         return pd.DataFrame(content_data)
+    
+    def find_next_page_url(self, next_selector: str = None) -> Optional[str]:
+        """Find the next page link via a custom selector or rel=next"""
+        if self.soup is None:
+            return None
+        
+        selectors = [next_selector] if next_selector else ['link[rel~=next]', 'a[rel~=next]']
+        for selector in selectors:
+            element = compile_selector(selector).select_one(self.soup)
+            if element is not None and element.get('href'):
+                return urljoin(self.url, element['href'])
+        return None
+    
+    def _spawn(self, url: str) -> 'AdvancedWebScraper':
+        """Create a scraper for another page that reuses this scraper's connections"""
+        scraper = AdvancedWebScraper(url, use_selenium=self.use_selenium, max_bytes=self.max_bytes,
+                                     transport=self.transport, host_health=self.host_health)
+        scraper.headers = self.headers
+        return scraper
+    
+    def iter_pages(self, extractor: Callable[['AdvancedWebScraper'], pd.DataFrame],
+                   next_selector: str = None, url_template: str = None,
+                   start_page: int = 1, end_page: int = None, max_pages: int = 50,
+                   max_workers: int = 4, delay: float = 0) -> Iterator[Tuple[str, pd.DataFrame]]:
+        """
+        Yield (url, frame) for each page, in page order.
+        
+        With a URL template ('...?page={page}') and a known end page, pages are
+        fetched concurrently; otherwise next links are followed one at a time.
+        Pages that could not be fetched are not yielded; they are collected
+        in self.failed_pages so the caller can report them.
+        """
+        self.failed_pages = []
+        
+        if url_template and end_page:
+            last_page = min(end_page, start_page + max_pages - 1)
+            urls = [url_template.format(page=page) for page in range(start_page, last_page + 1)]
+            
+            def fetch_and_extract(page_url):
+                page = self._spawn(page_url)
+                # No ScriptRunContext on pool threads - errors are reported by the caller
+                page.quiet = True
+                if not page.fetch_page():
+                    return page_url, None, page.last_error or "Could not fetch page"
+                return page_url, extractor(page), None
+            
+            executor = ThreadPoolExecutor(max_workers=max(1, max_workers))
+            futures = [executor.submit(fetch_and_extract, page_url) for page_url in urls]
+            try:
+                for future in futures:
+                    page_url, df, error = future.result()
+                    if error is not None:
+                        self.failed_pages.append((page_url, error))
+                        continue
+                    yield page_url, df
+            finally:
+                # Stop scheduling further pages if the consumer bailed out early
+                for future in futures:
+                    future.cancel()
+                executor.shutdown(wait=False)
+            return
+        
+        if url_template:
+            page_url = url_template.format(page=start_page)
+        else:
+            page_url = self.url
+        
+        seen_urls = set()
+        page_number = start_page
+        while page_url and page_url not in seen_urls and len(seen_urls) < max_pages:
+            seen_urls.add(page_url)
+            page = self if page_url == self.url and self.soup is not None else self._spawn(page_url)
+            # Failures are collected in failed_pages for the caller to report
+            if page is not self:
+                page.quiet = True
+            if page.soup is None and not page.fetch_page():
+                # With no known last page, a 404 past the end is where the listing stops
+                if not (url_template and page_number > start_page and page.last_status in (404, 410)):
+                    self.failed_pages.append((page_url, page.last_error or "Could not fetch page"))
+                break
+            
+            yield page_url, extractor(page)
+            
+            if url_template:
+                page_number += 1
+                page_url = url_template.format(page=page_number)
+            else:
+                page_url = page.find_next_page_url(next_selector)
+            
+            if page_url and delay > 0:
+                time.sleep(delay)
+    
+    def scrape_paginated(self, extractor: Callable[['AdvancedWebScraper'], pd.DataFrame],
+                         stop_when_no_new_rows: bool = True, **page_options) -> pd.DataFrame:
+        """
+        Stream every page's extracted frame into one combined result.
+        
+        Stops at the first page with no new rows; pages that failed to fetch
+        don't count as empty and are left in self.failed_pages.
+        """
+        frames = []
+        seen_rows = set()
+        
+        for page_url, df in self.iter_pages(extractor, **page_options):
+            if df is None or df.empty:
+                if stop_when_no_new_rows:
+                    break
+                continue
+            
+            row_hashes = DataProcessor.hash_rows(df)
+            is_new = ~row_hashes.isin(seen_rows)
+            if stop_when_no_new_rows and not is_new.any():
+                break
+            
+            seen_rows.update(row_hashes[is_new])
+            df = df[is_new.values].copy()
+            df['source_url'] = page_url
+            frames.append(df)
+        
+        if not frames:
+            return pd.DataFrame()
+        return pd.concat(frames, ignore_index=True)
+
 
 
+class SpilledFrame:
+    """
+    Read-only handle to a result stored in a memory-mapped Arrow IPC file.
+    
+    Supports the parts of the DataFrame API the app uses (len, columns,
+    column access and take), materializing only what is asked for.
+    """
+    
+    # Checked instead of isinstance: Streamlit reruns redefine this class,
+    # while handles in session state belong to the run that created them
+    spilled = True
+    
+    def __init__(self, path: str):
+        self.path = path
+        self.table = lazy_import('pyarrow.feather').read_table(path, memory_map=True)
+        self.columns = pd.Index(self.table.column_names)
+    
+    def __len__(self) -> int:
+        return self.table.num_rows
+    
+    @property
+    def shape(self) -> Tuple[int, int]:
+        return self.table.num_rows, self.table.num_columns
+    
+    def __getitem__(self, column: str) -> pd.Series:
+        return self.table.column(column).to_pandas().rename(column)
+    
+    def take(self, positions) -> pd.DataFrame:
+        """Materialize only the given rows, keeping their positions as the index"""
+        positions = np.asarray(positions, dtype=np.int64)
+        df = self.table.take(lazy_import('pyarrow').array(positions)).to_pandas()
+        df.index = positions
+        return df
+    
+    def null_count(self) -> int:
+        return sum(column.null_count for column in self.table.columns)
+    
+    @property
+    def nbytes(self) -> int:
+        # From the mapped table, which stays readable even if the file is unlinked
+        return self.table.nbytes
+    
+    def to_pandas(self) -> pd.DataFrame:
+        return self.table.to_pandas()
+    
+    def touch(self) -> bool:
+        """Mark the file as in use so idle collection leaves it alone; False if it is gone"""
+        try:
+            os.utime(self.path)
+        except OSError:
+            return False
+        return True
+
+
+def is_spilled(data) -> bool:
+    """True for SpilledFrame handles, including ones from earlier reruns"""
+    return getattr(data, 'spilled', False) is True
+
+
+
+class SpillStore:
+    """Moves large results out of session RAM into memory-mapped files"""
+    
+    DIRECTORY = 'spill'
+    THRESHOLD_BYTES = 64 * 1024 * 1024
+    IDLE_SECONDS = 2 * 60 * 60
+    
+    @staticmethod
+    def store(df: pd.DataFrame):
+        """Return df, or a SpilledFrame once df is larger than THRESHOLD_BYTES"""
+        if not ARROW_AVAILABLE or df.memory_usage(deep=True).sum() < SpillStore.THRESHOLD_BYTES:
+            return df
+        
+        pa = lazy_import('pyarrow')
+        pa_feather = lazy_import('pyarrow.feather')
+        
+        os.makedirs(SpillStore.DIRECTORY, exist_ok=True)
+        path = os.path.join(SpillStore.DIRECTORY, f"{uuid.uuid4().hex}.arrow")
+        try:
+            table = pa.Table.from_pandas(df.rename(columns=str), preserve_index=False)
+            # Uncompressed so reads map straight onto the file
+            pa_feather.write_feather(table, path, compression='uncompressed')
+        except (pa.ArrowException, TypeError, ValueError):
+            # Mixed-type columns Arrow can't represent stay in memory
+            if os.path.exists(path):
+                os.remove(path)
+            return df
+        return SpilledFrame(path)
+    
+    @staticmethod
+    def release(data):
+        """Delete a spilled result's file once the session drops it"""
+        if is_spilled(data):
+            try:
+                os.remove(data.path)
+            except OSError:
+                pass
+    
+    @staticmethod
+    def collect_idle():
+        """Remove spill files no session has touched for IDLE_SECONDS"""
+        if not os.path.isdir(SpillStore.DIRECTORY):
+            return
+        cutoff = time.time() - SpillStore.IDLE_SECONDS
+        for entry in os.scandir(SpillStore.DIRECTORY):
+            try:
+                if entry.is_file() and entry.stat().st_mtime < cutoff:
+                    os.remove(entry.path)
+            except OSError:
+                continue
+
 
 class DataProcessor:
     """Utilities for cleaning and processing scraped data"""
     
+    # Rows converted to pandas at once when exporting a spilled result
+    EXPORT_CHUNK_ROWS = 50_000
+    
     @staticmethod
     def flatten_columns(df: pd.DataFrame) -> pd.DataFrame:
         """Flatten MultiIndex columns to simple strings"""
@@ -264,112 +1260,837 @@ class DataProcessor:
 
 
     
-    @staticmethod
-    def remove_empty_columns(df: pd.DataFrame, threshold: float = 0.5) -> pd.DataFrame:
-        """Remove columns with too many missing values"""
-        missing_ratio = df.isnull().sum() / len(df)
-        cols_to_keep = missing_ratio[missing_ratio < threshold].index
-        return df[cols_to_keep]
+    @staticmethod
+    def hash_rows(df: pd.DataFrame) -> pd.Series:
+        """Stable per-row hash, used to spot rows already seen"""
+        try:
+            return pd.util.hash_pandas_object(df, index=False)
+        except TypeError:
+            # Unhashable cells (lists/dicts from JSON) - hash their string form
+            return pd.util.hash_pandas_object(df.astype(str), index=False)
+    
+    @staticmethod
+    def remove_empty_columns(df: pd.DataFrame, threshold: float = 0.5) -> pd.DataFrame:
+        """Remove columns with too many missing values"""
+        missing_ratio = df.isnull().sum() / len(df)
+        cols_to_keep = missing_ratio[missing_ratio < threshold].index
+        return df[cols_to_keep]
+    
+    @staticmethod
+    def detect_column_types(df: pd.DataFrame) -> pd.DataFrame:
+        """Auto-detect and convert column types"""
+        for col in df.columns:
+            # Try to convert to numeric
+            try:
+                df[col] = pd.to_numeric(df[col])
+                continue
+            except (ValueError, TypeError):
+                pass
+            
+            # Try to convert to datetime
+            try:
+                df[col] = pd.to_datetime(df[col])
+                continue
+            except (ValueError, TypeError):
+                pass
+        
+        return df
+    
+    @staticmethod
+    def export_to_csv(df: pd.DataFrame, filename: str = None) -> bytes:
+        """Export DataFrame to CSV"""
+        if filename is None:
+            filename = f"scraped_data_{datetime.now().strftime('%Y%m%d_%H%M%S')}.csv"
+        
+        if is_spilled(df):
+            # Converted a slice at a time, in the same format as the in-memory path
+            output = io.BytesIO()
+            for start in range(0, max(len(df), 1), DataProcessor.EXPORT_CHUNK_ROWS):
+                chunk = df.table.slice(start, DataProcessor.EXPORT_CHUNK_ROWS).to_pandas()
+                output.write(chunk.to_csv(index=False, header=start == 0).encode('utf-8'))
+            return output.getvalue()
+        
+        return df.to_csv(index=False).encode('utf-8')
+    
+    @staticmethod
+    def export_to_excel(df: pd.DataFrame, filename: str = None) -> bytes:
+        """Export DataFrame to Excel"""
+        if filename is None:
+            filename = f"scraped_data_{datetime.now().strftime('%Y%m%d_%H%M%S')}.xlsx"
+        
+        # Make a copy to avoid modifying original (as modifying the OG may cause a severe heart attack)
+        # Spilled results are materialized fresh, so they need no extra copy
+        df = df.to_pandas() if is_spilled(df) else df.copy()
+        
+        # Flatten columns if MultiIndex
+        df = DataProcessor.flatten_columns(df)
+        
+        output = io.BytesIO()
+        with pd.ExcelWriter(output, engine='openpyxl') as writer:
+            df.to_excel(writer, index=False, sheet_name='Scraped Data')
+        
+        return output.getvalue()
+
+
+
+
+    @staticmethod
+    def export_to_json(df: pd.DataFrame) -> str:
+        """Export DataFrame to JSON"""
+        if is_spilled(df):
+            df = df.to_pandas()
+        return df.to_json(orient='records', indent=2)
+    
+    @staticmethod
+    def count_missing(df) -> int:
+        """Total missing cells (read from Arrow metadata for spilled results)"""
+        if is_spilled(df):
+            return df.null_count()
+        return int(df.isnull().sum().sum())
+    
+    @staticmethod
+    def memory_label(df) -> str:
+        """Human-readable size of a result, in RAM or on disk"""
+        if is_spilled(df):
+            return f"{df.nbytes / 1024 / 1024:.1f} MB (disk)"
+        return f"{df.memory_usage(deep=True).sum() / 1024:.1f} KB"
+    
+    # Largest slice ever rendered as text for the clipboard view
+    CLIPBOARD_MAX_ROWS = 1000
+    
+    @staticmethod
+    def view_positions(df: pd.DataFrame, sort_by: str = None, ascending: bool = True,
+                       filter_column: str = None, filter_text: str = None) -> np.ndarray:
+        """Row positions of the stored frame after filtering and sorting"""
+        if filter_column and filter_text:
+            mask = df[filter_column].astype(str).str.contains(filter_text, case=False, regex=False, na=False)
+            positions = np.flatnonzero(mask.to_numpy())
+        else:
+            positions = np.arange(len(df))
+        
+        if sort_by:
+            values = df[sort_by].iloc[positions].reset_index(drop=True)
+            try:
+                order = values.sort_values(ascending=ascending, kind='stable', na_position='last').index
+            except TypeError:
+                # Mixed types (e.g. numbers and strings) don't compare; sort them as text
+                values = values.astype(str).mask(values.isna())
+                order = values.sort_values(ascending=ascending, kind='stable', na_position='last').index
+            positions = positions[order.to_numpy()]
+        
+        return positions
+    
+    @staticmethod
+    def get_page(df: pd.DataFrame, positions: np.ndarray, page: int, page_size: int) -> pd.DataFrame:
+        """Slice one page of rows without touching the rest of the frame"""
+        start = max(page - 1, 0) * page_size
+        return df.take(positions[start:start + page_size])
+    
+    # Frames larger than this are profiled for top values on a sample
+    PROFILE_SAMPLE_ROWS = 200_000
+    
+    @staticmethod
+    def approx_distinct(series: pd.Series, k: int = 1024) -> int:
+        """Estimate distinct values with a k-minimum-values sketch over row hashes"""
+        values = series.dropna()
+        if len(values) <= k:
+            return int(values.nunique())
+        
+        try:
+            hashes = pd.util.hash_pandas_object(values, index=False).values
+        except TypeError:
+            hashes = pd.util.hash_pandas_object(values.astype(str), index=False).values
+        
+        m = min(4 * k, len(hashes) - 1)
+        smallest = np.unique(np.partition(hashes, m)[:m])
+        if len(smallest) < k:
+            # Heavy repetition - the exact count is cheap enough
+            return int(np.unique(hashes).size)
+        
+        kth = float(smallest[k - 1]) / np.iinfo(np.uint64).max
+        return int(round((k - 1) / kth))
+    
+    @staticmethod
+    def profile_dataframe(df: pd.DataFrame, bins: int = 30, top_k: int = 10) -> Dict:
+        """
+        Compute a column profile once per dataset.
+        
+        Histograms are binned server-side so charts never receive raw rows;
+        top values are taken from a sample on very large frames.
+        """
+        rows = len(df)
+        sampled = rows > DataProcessor.PROFILE_SAMPLE_ROWS
+        if sampled:
+            rng = np.random.default_rng(0)
+            sample = df.take(np.sort(rng.choice(rows, DataProcessor.PROFILE_SAMPLE_ROWS, replace=False)))
+        else:
+            sample = df
+        scale = rows / len(sample) if len(sample) else 1
+        
+        profile = {'rows': rows, 'sampled': sampled, 'columns': {}}
+        
+        # Column by column, so spilled results only ever materialize one column
+        for col in df.columns:
+            series = df[col]
+            info = {
+                'dtype': str(series.dtype),
+                'nulls': int(series.isna().sum()),
+                'distinct': DataProcessor.approx_distinct(series)
+            }
+            
+            if pd.api.types.is_numeric_dtype(series) and not pd.api.types.is_bool_dtype(series):
+                values = series.dropna().to_numpy(dtype=float)
+                values = values[np.isfinite(values)]
+                if len(values):
+                    counts, edges = np.histogram(values, bins=bins)
+                    info.update({
+                        'kind': 'numeric',
+                        'mean': float(values.mean()),
+                        'median': float(np.median(values)),
+                        'std': float(values.std(ddof=1)) if len(values) > 1 else float('nan'),
+                        'min': float(values.min()),
+                        'max': float(values.max()),
+                        'hist_counts': counts,
+                        'hist_edges': edges
+                    })
+            elif series.dtype == object or isinstance(series.dtype, pd.StringDtype):
+                top = sample[col].astype(str).where(sample[col].notna()).value_counts().head(top_k)
+                info.update({
+                    'kind': 'categorical',
+                    'top_values': (top * scale).round().astype(int) if sampled else top
+                })
+            
+            profile['columns'][col] = info
+        
+        return profile
+    
+    @staticmethod
+    def get_data_summary(df: pd.DataFrame) -> Dict:
+        """Generate summary statistics for the DataFrame"""
+        return {
+            'rows': len(df),
+            'columns': len(df.columns),
+            'memory_usage': f"{df.memory_usage(deep=True).sum() / 1024:.2f} KB",
+            'missing_values': df.isnull().sum().sum(),
+            'duplicate_rows': df.duplicated().sum()
+        }
+
+
+def extract_by_method(scraper: AdvancedWebScraper, method: str, custom_selector: str = None,
+                      custom_attrs: List[str] = None, text_tags: List[str] = None,
+                      schema_container: str = None, schema_fields: Dict = None) -> pd.DataFrame:
+    """Run one extraction method on a fetched page without any UI side effects"""
+    if method == "Auto-detect Tables":
+        tables = scraper.extract_tables()
+        return DataProcessor.flatten_columns(tables[0]) if tables else pd.DataFrame()
+    if method == "Extract Links":
+        return scraper.extract_links()
+    if method == "Extract Images":
+        return scraper.extract_images()
+    if method == "Extract Text Content":
+        return scraper.extract_text_content(text_tags)
+    if method == "Custom CSS Selector" and custom_selector:
+        return scraper.extract_custom_selector(custom_selector, custom_attrs)
+    if method == "Schema (Record Fields)" and schema_container and schema_fields:
+        return scraper.extract_schema(schema_container, schema_fields)
+    if method == "Meta Tags":
+        return scraper.extract_meta_data()
+    if method == "Structured Data":
+        return structured_to_frame(scraper.extract_structured_data())
+    return pd.DataFrame()
+
+
+
+class DeltaStore:
+    """
+    Append-only delta log for a scheduled job.
+    
+    Keeps a compact index of key -> row hash so each run only records the
+    rows that were added, removed or changed since the previous run. The
+    index also records the URL and key columns it was built for, and a
+    store refuses to reuse an index written for a different job.
+    """
+    
+    KEY_SEPARATOR = '\x1f'
+    
+    def __init__(self, job_id: str, key_columns: List[str] = None, base_dir: str = 'deltas',
+                 url: str = None):
+        self.job_id = job_id
+        self.url = url
+        self.key_columns = key_columns or []
+        self.directory = os.path.join(base_dir, job_id)
+        self.index_path = os.path.join(self.directory, 'index.json')
+        self.log_path = os.path.join(self.directory, 'delta.jsonl')
+        os.makedirs(self.directory, exist_ok=True)
+        
+        self.index = {}
+        if os.path.exists(self.index_path):
+            with open(self.index_path, 'r', encoding='utf-8') as f:
+                stored = json.load(f)
+            if stored.get('url') != self.url or stored.get('key_columns') != self.key_columns:
+                raise ValueError(
+                    f"Delta log {self.directory} belongs to {stored.get('url')} "
+                    f"keyed on {stored.get('key_columns')}, not to this job"
+                )
+            self.index = stored['rows']
+    
+    @staticmethod
+    def _key_part(value) -> str:
+        """Text for one key cell: empty cells become '' and 3.0 matches 3"""
+        if pd.api.types.is_scalar(value) and pd.isna(value):
+            return ''
+        if isinstance(value, float) and value.is_integer():
+            # An empty cell elsewhere turns an int column into floats
+            return str(int(value))
+        return str(value)
+    
+    def _row_keys(self, df: pd.DataFrame, row_hashes: pd.Series) -> pd.Series:
+        """Key each row by its key columns, or by its full content when none are set"""
+        if self.key_columns and not df.empty:
+            parts = df[self.key_columns].apply(lambda col: col.map(self._key_part))
+            return parts.agg(self.KEY_SEPARATOR.join, axis=1)
+        if self.key_columns:
+            # agg on zero rows returns a frame, not a Series
+            return pd.Series([], index=df.index, dtype=object)
+        return row_hashes
+    
+    def apply(self, df: pd.DataFrame, timestamp: datetime = None) -> Dict[str, pd.DataFrame]:
+        """Diff a fresh scrape against the index and append the changes to the log"""
+        timestamp = timestamp or datetime.now()
+        
+        # A run that found nothing removes every known row
+        if df.empty:
+            df = df.reindex(columns=df.columns.union(self.key_columns, sort=False))
+        
+        missing = [col for col in self.key_columns if col not in df.columns]
+        if missing:
+            raise KeyError(f"Key columns not in scraped data: {missing}")
+        
+        df = df.reset_index(drop=True)
+        row_hashes = DataProcessor.hash_rows(df).map('{:016x}'.format)
+        keys = self._row_keys(df, row_hashes)
+        
+        # Last occurrence wins when a key repeats within one scrape
+        latest = ~keys.duplicated(keep='last')
+        df, keys, row_hashes = df[latest], keys[latest], row_hashes[latest]
+        
+        previous = keys.map(self.index)
+        added = previous.isna()
+        changed = ~added & (previous != row_hashes)
+        removed_keys = sorted(set(self.index) - set(keys))
+        
+        ts = timestamp.isoformat()
+        with open(self.log_path, 'a', encoding='utf-8') as log:
+            for op, mask in (('added', added), ('changed', changed)):
+                if not mask.any():
+                    continue
+                rows = json.loads(df[mask].to_json(orient='records', date_format='iso'))
+                for key, row in zip(keys[mask], rows):
+                    log.write(json.dumps({'ts': ts, 'op': op, 'key': key, 'row': row}) + '\n')
+            for key in removed_keys:
+                log.write(json.dumps({'ts': ts, 'op': 'removed', 'key': key}) + '\n')
+        
+        self.index = dict(zip(keys, row_hashes))
+        tmp_path = self.index_path + '.tmp'
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump({'url': self.url, 'key_columns': self.key_columns, 'rows': self.index}, f)
+        os.replace(tmp_path, self.index_path)
+        
+        if self.key_columns:
+            removed = pd.DataFrame(
+                [key.split(self.KEY_SEPARATOR) for key in removed_keys],
+                columns=self.key_columns
+            )
+        else:
+            removed = pd.DataFrame({'row_hash': removed_keys})
+        
+        return {
+            'added': df[added].reset_index(drop=True),
+            'changed': df[changed].reset_index(drop=True),
+            'removed': removed
+        }
+    
+    def snapshot(self, at: datetime = None) -> pd.DataFrame:
+        """Rebuild the full table as it was at a point in time (latest by default)"""
+        state = {}
+        if os.path.exists(self.log_path):
+            cutoff = at.isoformat() if at else None
+            with open(self.log_path, 'r', encoding='utf-8') as log:
+                for line in log:
+                    entry = json.loads(line)
+                    if cutoff and entry['ts'] > cutoff:
+                        break
+                    if entry['op'] == 'removed':
+                        state.pop(entry['key'], None)
+                    else:
+                        state[entry['key']] = entry['row']
+        return pd.DataFrame(list(state.values()))
+
+
+class HistoryStore:
+    """
+    Durable scrape history backed by SQLite.
+    
+    Runs from every session and from scheduled jobs land in one table,
+    indexed by URL, method and timestamp. Totals are maintained by
+    triggers so the History tab never has to scan the runs table.
+    """
     
-    @staticmethod
-    def detect_column_types(df: pd.DataFrame) -> pd.DataFrame:
-        """Auto-detect and convert column types"""
-        for col in df.columns:
-            # Try to convert to numeric
-            try:
-                df[col] = pd.to_numeric(df[col])
-                continue
-            except (ValueError, TypeError):
-                pass
-            
-            # Try to convert to datetime
-            try:
-                df[col] = pd.to_datetime(df[col])
-                continue
-            except (ValueError, TypeError):
-                pass
+    SCHEMA = """
+        CREATE TABLE IF NOT EXISTS runs (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            timestamp TEXT NOT NULL,
+            url TEXT NOT NULL,
+            method TEXT NOT NULL,
+            rows INTEGER NOT NULL DEFAULT 0,
+            columns INTEGER NOT NULL DEFAULT 0,
+            source TEXT NOT NULL DEFAULT 'interactive',
+            job_id TEXT,
+            status TEXT NOT NULL DEFAULT 'ok'
+        );
+        CREATE INDEX IF NOT EXISTS idx_runs_timestamp ON runs (timestamp);
+        CREATE INDEX IF NOT EXISTS idx_runs_url ON runs (url, timestamp);
+        CREATE INDEX IF NOT EXISTS idx_runs_method ON runs (method, timestamp);
+        CREATE INDEX IF NOT EXISTS idx_runs_source ON runs (source, timestamp);
         
-        return df
-    
-    @staticmethod
-    def export_to_csv(df: pd.DataFrame, filename: str = None) -> bytes:
-        """Export DataFrame to CSV"""
-        if filename is None:
-            filename = f"scraped_data_{datetime.now().strftime('%Y%m%d_%H%M%S')}.csv"
+        CREATE TABLE IF NOT EXISTS run_totals (
+            id INTEGER PRIMARY KEY CHECK (id = 1),
+            runs INTEGER NOT NULL,
+            rows INTEGER NOT NULL,
+            urls INTEGER NOT NULL
+        );
+        INSERT OR IGNORE INTO run_totals (id, runs, rows, urls) VALUES (1, 0, 0, 0);
         
-        return df.to_csv(index=False).encode('utf-8')
-    
-    @staticmethod
-    def export_to_excel(df: pd.DataFrame, filename: str = None) -> bytes:
-        """Export DataFrame to Excel"""
-        if filename is None:
-            filename = f"scraped_data_{datetime.now().strftime('%Y%m%d_%H%M%S')}.xlsx"
+        CREATE TABLE IF NOT EXISTS url_totals (
+            url TEXT PRIMARY KEY,
+            runs INTEGER NOT NULL
+        );
         
-        # Make a copy to avoid modifying original (as modifying the OG may cause a severe heart attack)
-        df = df.copy()
+        CREATE TABLE IF NOT EXISTS method_totals (
+            method TEXT PRIMARY KEY,
+            runs INTEGER NOT NULL
+        );
         
-        # Flatten columns if MultiIndex
-        df = DataProcessor.flatten_columns(df)
+        CREATE TRIGGER IF NOT EXISTS runs_totals_insert AFTER INSERT ON runs
+        BEGIN
+            UPDATE run_totals SET
+                runs = runs + 1,
+                rows = rows + NEW.rows,
+                urls = urls + (NOT EXISTS (SELECT 1 FROM url_totals WHERE url = NEW.url))
+            WHERE id = 1;
+            INSERT INTO url_totals (url, runs) VALUES (NEW.url, 1)
+                ON CONFLICT (url) DO UPDATE SET runs = runs + 1;
+        END;
         
-        output = io.BytesIO()
-        with pd.ExcelWriter(output, engine='openpyxl') as writer:
-            df.to_excel(writer, index=False, sheet_name='Scraped Data')
+        CREATE TRIGGER IF NOT EXISTS runs_method_totals_insert AFTER INSERT ON runs
+        BEGIN
+            INSERT INTO method_totals (method, runs) VALUES (NEW.method, 1)
+                ON CONFLICT (method) DO UPDATE SET runs = runs + 1;
+        END;
+        -- Backfills databases created before method_totals existed (no-op afterwards)
+        INSERT INTO method_totals (method, runs)
+            SELECT method, COUNT(*) FROM runs
+            WHERE NOT EXISTS (SELECT 1 FROM method_totals)
+            GROUP BY method;
+    """
+    
+    def __init__(self, path: str = 'mojo_history.db'):
+        self.path = path
+        with closing(self._connect()) as conn:
+            conn.execute('PRAGMA journal_mode=WAL')
+            conn.executescript(self.SCHEMA)
+    
+    def _connect(self) -> sqlite3.Connection:
+        """Open a short-lived connection (safe to use from scheduler threads)"""
+        return sqlite3.connect(self.path, timeout=30)
+    
+    def record(self, url: str, method: str, rows: int = 0, columns: int = 0,
+               source: str = 'interactive', job_id: str = None, status: str = 'ok',
+               timestamp: datetime = None):
+        """Append one scrape run"""
+        timestamp = timestamp or datetime.now()
+        with closing(self._connect()) as conn, conn:
+            conn.execute(
+                'INSERT INTO runs (timestamp, url, method, rows, columns, source, job_id, status) '
+                'VALUES (?, ?, ?, ?, ?, ?, ?, ?)',
+                (timestamp.isoformat(sep=' '), url, method, int(rows), int(columns), source, job_id, status)
+            )
+    
+    def _where(self, url: str = None, method: str = None, source: str = None) -> Tuple[str, list]:
+        """Build a WHERE clause from optional equality filters"""
+        clauses, params = [], []
+        for column, value in (('url', url), ('method', method), ('source', source)):
+            if value:
+                clauses.append(f'{column} = ?')
+                params.append(value)
+        return (' WHERE ' + ' AND '.join(clauses)) if clauses else '', params
+    
+    def query(self, page_size: int = 100, url: str = None, method: str = None, source: str = None,
+              after: Tuple[str, int] = None) -> Tuple[pd.DataFrame, Optional[Tuple[str, int]]]:
+        """
+        Fetch one page of runs, newest first, and the cursor for the next page.
         
-        return output.getvalue()
+        Pages are keyed on (timestamp, id) rather than OFFSET, so a deep page
+        seeks straight to its first row through the index.
+        """
+        where, params = self._where(url, method, source)
+        if after is not None:
+            where += (' AND ' if where else ' WHERE ') + '(timestamp, id) < (?, ?)'
+            params = params + list(after)
+        with closing(self._connect()) as conn:
+            df = pd.read_sql_query(
+                'SELECT id, timestamp, url, method, rows, columns, source, job_id, status FROM runs'
+                f'{where} ORDER BY timestamp DESC, id DESC LIMIT ?',
+                conn,
+                params=params + [page_size + 1]
+            )
+        
+        # The extra row only tells whether another page exists
+        next_cursor = None
+        if len(df) > page_size:
+            df = df.iloc[:page_size]
+            next_cursor = (df['timestamp'].iloc[-1], int(df['id'].iloc[-1]))
+        df = df.drop(columns='id')
+        df['timestamp'] = pd.to_datetime(df['timestamp'])
+        return df, next_cursor
+    
+    def count(self, url: str = None, method: str = None, source: str = None) -> int:
+        """Number of runs matching the filters (unfiltered count is precomputed)"""
+        where, params = self._where(url, method, source)
+        with closing(self._connect()) as conn:
+            if not where:
+                return conn.execute('SELECT runs FROM run_totals WHERE id = 1').fetchone()[0]
+            return conn.execute(f'SELECT COUNT(*) FROM runs{where}', params).fetchone()[0]
+    
+    def totals(self) -> Dict:
+        """Precomputed aggregates over every recorded run"""
+        with closing(self._connect()) as conn:
+            runs, rows, urls = conn.execute(
+                'SELECT runs, rows, urls FROM run_totals WHERE id = 1'
+            ).fetchone()
+        return {'runs': runs, 'rows': rows, 'urls': urls}
+    
+    def distinct_methods(self) -> List[str]:
+        """Extraction methods seen so far (from the trigger-maintained totals)"""
+        with closing(self._connect()) as conn:
+            return [row[0] for row in conn.execute('SELECT method FROM method_totals ORDER BY method')]
+    
+    def clear(self):
+        """Delete every run and reset the aggregates"""
+        with closing(self._connect()) as conn, conn:
+            conn.execute('DELETE FROM runs')
+            conn.execute('DELETE FROM url_totals')
+            conn.execute('DELETE FROM method_totals')
+            conn.execute('UPDATE run_totals SET runs = 0, rows = 0, urls = 0 WHERE id = 1')
+
 
 
+def run_scrape_task(job_id: str, url: str, export_format: str = 'csv', use_selenium: bool = False,
+                    transport: str = 'requests', incremental: bool = False, key_columns: List[str] = None,
+                    delta_store: DeltaStore = None, history: HistoryStore = None,
+                    host_health: HostHealth = None) -> Dict:
+    """
+    Run the scheduled-scrape pipeline once: fetch, extract, then save or diff.
+    
+    Shared by in-process scheduled jobs and queue workers. Raises on failure
+    after recording the failed run in the history store.
+    """
+    if incremental and delta_store is None:
+        delta_store = DeltaStore(job_id, key_columns, url=url)
+    
+    scraper = AdvancedWebScraper(url, use_selenium=use_selenium, transport=transport,
+                                 host_health=host_health)
+    method = 'Auto-detect Tables'
+    try:
+        if not scraper.fetch_page():
+            raise RuntimeError(scraper.last_error or f"Could not fetch {url}")
+        
+        # Try to extract tables first
+        tables = scraper.extract_tables()
+        if tables:
+            df = tables[0]  
+        else:
+            # Fallback to text content
+            df = scraper.extract_text_content()
+            method = 'Extract Text Content'
+        
+        summary = {'rows': len(df), 'columns': len(df.columns)}
+        
+        # Incremental jobs only record what changed since the last run
+        if delta_store is not None:
+            delta = delta_store.apply(df)
+            summary.update({name: len(rows) for name, rows in delta.items()})
+        else:
+            # Save to file
+            timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
+            if export_format == 'csv':
+                summary['file'] = f"scheduled_{job_id}_{timestamp}.csv"
+                df.to_csv(summary['file'], index=False)
+            elif export_format == 'excel':
+                summary['file'] = f"scheduled_{job_id}_{timestamp}.xlsx"
+                df.to_excel(summary['file'], index=False)
+    except Exception:
+        if history is not None:
+            history.record(url, method, source='scheduled', job_id=job_id, status='failed')
+        raise
+    finally:
+        scraper.close()
+    
+    if history is not None:
+        history.record(url, method, rows=summary['rows'], columns=summary['columns'],
+                       source='scheduled', job_id=job_id)
+    return summary
 
 
-    @staticmethod
-    def export_to_json(df: pd.DataFrame) -> str:
-        """Export DataFrame to JSON"""
-        return df.to_json(orient='records', indent=2)
+class TaskBroker:
+    """
+    Interface between the scheduler and scrape workers.
     
-    @staticmethod
-    def get_data_summary(df: pd.DataFrame) -> Dict:
-        """Generate summary statistics for the DataFrame"""
-        return {
-            'rows': len(df),
-            'columns': len(df.columns),
-            'memory_usage': f"{df.memory_usage(deep=True).sum() / 1024:.2f} KB",
-            'missing_values': df.isnull().sum().sum(),
-            'duplicate_rows': df.duplicated().sum()
-        }
+    The scheduler enqueues tasks; workers lease one at a time, heartbeat
+    while running and report the result. TaskQueue implements it on a local
+    SQLite file. A networked backend (Redis, Postgres, ...) can implement the
+    same methods and register in BROKERS to fan workers out over several
+    hosts; those workers also need the app's deltas/ directory shared.
+    """
+    
+    def enqueue(self, job_id: str, payload: Dict) -> int:
+        """Add a task and return its id"""
+        raise NotImplementedError
+    
+    def lease(self, worker_id: str, lease_seconds: float = 300) -> Optional[Dict]:
+        """Claim the next runnable task as {'id', 'job_id', 'payload', 'attempts'}, or None"""
+        raise NotImplementedError
+    
+    def heartbeat(self, task_id: int, worker_id: str, lease_seconds: float = 300) -> bool:
+        """Extend a lease; False means the lease was lost to another worker"""
+        raise NotImplementedError
+    
+    def complete(self, task_id: int, worker_id: str, result: Dict):
+        """Mark a leased task as done"""
+        raise NotImplementedError
+    
+    def fail(self, task_id: int, worker_id: str, error: str):
+        """Requeue a failed task, or give up after max_attempts"""
+        raise NotImplementedError
+    
+    def register_worker(self, worker_id: str, current_task: int = None):
+        """Record a worker heartbeat"""
+        raise NotImplementedError
+    
+    def stats(self) -> Dict[str, int]:
+        """Task counts by status"""
+        raise NotImplementedError
+    
+    def workers(self, active_within: float = 120) -> pd.DataFrame:
+        """Workers that sent a heartbeat recently"""
+        raise NotImplementedError
 
 
+class TaskQueue(TaskBroker):
+    """
+    Lease-based task queue for scrape workers, backed by SQLite.
+    
+    The scheduler enqueues tasks; workers lease one at a time, heartbeat
+    while running and report the result. A lease that stops heartbeating
+    expires and the task goes back to the queue. Tasks of the same job
+    never run concurrently, so delta logs stay ordered. A task whose lease
+    expires max_attempts times (its worker crashed or hung) is failed.
+    
+    This is the local stand-in broker: workers must run on the app's machine,
+    since the database uses WAL mode, which SQLite does not support on
+    network filesystems, and delta logs are written locally.
+    """
+    
+    SCHEMA = """
+        CREATE TABLE IF NOT EXISTS tasks (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            job_id TEXT NOT NULL,
+            payload TEXT NOT NULL,
+            status TEXT NOT NULL DEFAULT 'queued',
+            attempts INTEGER NOT NULL DEFAULT 0,
+            enqueued_at TEXT NOT NULL,
+            lease_owner TEXT,
+            lease_expires REAL,
+            finished_at TEXT,
+            result TEXT,
+            error TEXT
+        );
+        CREATE INDEX IF NOT EXISTS idx_tasks_status ON tasks (status, id);
+        CREATE INDEX IF NOT EXISTS idx_tasks_job ON tasks (job_id, status);
+        
+        CREATE TABLE IF NOT EXISTS workers (
+            worker_id TEXT PRIMARY KEY,
+            host TEXT NOT NULL,
+            pid INTEGER NOT NULL,
+            last_seen REAL NOT NULL,
+            current_task INTEGER
+        );
+    """
+    
+    def __init__(self, path: str = 'mojo_queue.db', max_attempts: int = 3):
+        self.path = path
+        self.max_attempts = max_attempts
+        with closing(self._connect()) as conn:
+            conn.execute('PRAGMA journal_mode=WAL')
+            conn.executescript(self.SCHEMA)
+    
+    def _connect(self) -> sqlite3.Connection:
+        """Open a short-lived connection (safe to use from any thread or process)"""
+        return sqlite3.connect(self.path, timeout=30, isolation_level=None)
+    
+    def enqueue(self, job_id: str, payload: Dict) -> int:
+        """Add a task and return its id"""
+        with closing(self._connect()) as conn:
+            cursor = conn.execute(
+                'INSERT INTO tasks (job_id, payload, enqueued_at) VALUES (?, ?, ?)',
+                (job_id, json.dumps(payload), datetime.now().isoformat(sep=' '))
+            )
+            return cursor.lastrowid
+    
+    def lease(self, worker_id: str, lease_seconds: float = 300) -> Optional[Dict]:
+        """Claim the oldest runnable task (queued, or leased with an expired lease)"""
+        now = time.time()
+        with closing(self._connect()) as conn:
+            # IMMEDIATE takes the write lock up front so two workers can't claim the same row
+            conn.execute('BEGIN IMMEDIATE')
+            try:
+                # Expired leases that used up their attempts won't be retried again
+                conn.execute(
+                    "UPDATE tasks SET status = 'failed', finished_at = ?, lease_expires = NULL, "
+                    "error = 'Lease expired on every attempt (worker crashed or hung)' "
+                    "WHERE status = 'leased' AND lease_expires < ? AND attempts >= ?",
+                    (datetime.now().isoformat(sep=' '), now, self.max_attempts)
+                )
+                row = conn.execute(
+                    """
+                    SELECT id, job_id, payload, attempts FROM tasks
+                    WHERE (status = 'queued' OR (status = 'leased' AND lease_expires < :now))
+                      AND job_id NOT IN (
+                          SELECT job_id FROM tasks
+                          WHERE status = 'leased' AND lease_expires >= :now
+                      )
+                    ORDER BY id LIMIT 1
+                    """,
+                    {'now': now}
+                ).fetchone()
+                if row is None:
+                    conn.execute('COMMIT')
+                    return None
+                
+                task_id, job_id, payload, attempts = row
+                conn.execute(
+                    "UPDATE tasks SET status = 'leased', lease_owner = ?, lease_expires = ?, "
+                    "attempts = attempts + 1 WHERE id = ?",
+                    (worker_id, now + lease_seconds, task_id)
+                )
+                conn.execute('COMMIT')
+            except Exception:
+                conn.execute('ROLLBACK')
+                raise
+        
+        return {'id': task_id, 'job_id': job_id, 'payload': json.loads(payload), 'attempts': attempts + 1}
+    
+    def heartbeat(self, task_id: int, worker_id: str, lease_seconds: float = 300) -> bool:
+        """Extend a lease; False means the lease was lost to another worker"""
+        with closing(self._connect()) as conn:
+            cursor = conn.execute(
+                "UPDATE tasks SET lease_expires = ? WHERE id = ? AND lease_owner = ? AND status = 'leased'",
+                (time.time() + lease_seconds, task_id, worker_id)
+            )
+            return cursor.rowcount == 1
+    
+    def complete(self, task_id: int, worker_id: str, result: Dict):
+        """Mark a leased task as done"""
+        with closing(self._connect()) as conn:
+            conn.execute(
+                "UPDATE tasks SET status = 'done', finished_at = ?, result = ?, lease_expires = NULL "
+                "WHERE id = ? AND lease_owner = ?",
+                (datetime.now().isoformat(sep=' '), json.dumps(result, default=str), task_id, worker_id)
+            )
+    
+    def fail(self, task_id: int, worker_id: str, error: str):
+        """Requeue a failed task, or give up after max_attempts"""
+        with closing(self._connect()) as conn:
+            conn.execute(
+                "UPDATE tasks SET status = CASE WHEN attempts >= ? THEN 'failed' ELSE 'queued' END, "
+                "error = ?, finished_at = ?, lease_expires = NULL WHERE id = ? AND lease_owner = ?",
+                (self.max_attempts, error, datetime.now().isoformat(sep=' '), task_id, worker_id)
+            )
+    
+    def register_worker(self, worker_id: str, current_task: int = None):
+        """Record a worker heartbeat"""
+        with closing(self._connect()) as conn:
+            conn.execute(
+                'INSERT INTO workers (worker_id, host, pid, last_seen, current_task) VALUES (?, ?, ?, ?, ?) '
+                'ON CONFLICT (worker_id) DO UPDATE SET last_seen = excluded.last_seen, '
+                'current_task = excluded.current_task',
+                (worker_id, socket.gethostname(), os.getpid(), time.time(), current_task)
+            )
+    
+    def stats(self) -> Dict[str, int]:
+        """Task counts by status"""
+        with closing(self._connect()) as conn:
+            return dict(conn.execute('SELECT status, COUNT(*) FROM tasks GROUP BY status').fetchall())
+    
+    def workers(self, active_within: float = 120) -> pd.DataFrame:
+        """Workers that sent a heartbeat recently"""
+        with closing(self._connect()) as conn:
+            df = pd.read_sql_query(
+                'SELECT worker_id, host, pid, last_seen, current_task FROM workers '
+                'WHERE last_seen >= ? ORDER BY worker_id',
+                conn,
+                params=[time.time() - active_within]
+            )
+        df['last_seen'] = pd.to_datetime(df['last_seen'], unit='s')
+        return df
+
 
 class ScraperScheduler:
     """Background scheduler for automated scraping tasks"""
     
-    def __init__(self):
-        self.scheduler = BackgroundScheduler()
+    def __init__(self, history: HistoryStore = None, queue: TaskBroker = None,
+                 host_health: HostHealth = None):
+        background = lazy_import('apscheduler.schedulers.background')
+        self.scheduler = background.BackgroundScheduler()
         self.scheduler.start()
         self.jobs = {}
+        self.delta_stores = {}
+        self.history = history
+        self.queue = queue
+        self.host_health = host_health
     
     def add_job(self, job_id: str, url: str, interval_minutes: int, 
-                export_format: str = 'csv', use_selenium: bool = False):
+                export_format: str = 'csv', use_selenium: bool = False,
+                incremental: bool = False, key_columns: List[str] = None,
+                transport: str = 'requests', execution: str = 'local'):
         """Add a new scheduled scraping job"""
+        if execution == 'queue' and self.queue is None:
+            raise ValueError("Queue execution needs a task broker")
+        if incremental:
+            self.delta_stores[job_id] = DeltaStore(job_id, key_columns, url=url)
+        
+        payload = {
+            'url': url,
+            'export_format': export_format,
+            'use_selenium': use_selenium,
+            'transport': transport,
+            'incremental': incremental,
+            'key_columns': key_columns or []
+        }
         
         def scrape_job():
+            # Queue mode: workers run the pipeline, we only hand out the task
+            if execution == 'queue':
+                task_id = self.queue.enqueue(job_id, payload)
+                print(f"→ Job {job_id} queued as task {task_id} at {datetime.now()}")
+                return
+            
             try:
-                scraper = AdvancedWebScraper(url, use_selenium=use_selenium)
-                if scraper.fetch_page():
-                    # Try to extract tables first
-                    tables = scraper.extract_tables()
-                    if tables:
-                        df = tables[0]  
-                    else:
-                        # Fallback to text content
-                        df = scraper.extract_text_content()
-                    
-                    # Save to file
-                    timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
-                    if export_format == 'csv':
-                        df.to_csv(f"scheduled_{job_id}_{timestamp}.csv", index=False)
-                    elif export_format == 'excel':
-                        df.to_excel(f"scheduled_{job_id}_{timestamp}.xlsx", index=False)
-                    
-                    print(f"✓ Job {job_id} completed at {datetime.now()}")
+                summary = run_scrape_task(
+                    job_id, delta_store=self.delta_stores.get(job_id), history=self.history,
+                    host_health=self.host_health, **payload
+                )
+                print(f"✓ Job {job_id} completed at {datetime.now()}: {summary}")
             except Exception as e:
                 print(f"✗ Job {job_id} failed: {e}")
         
@@ -383,7 +2104,10 @@ class ScraperScheduler:
         self.jobs[job_id] = {
             'url': url,
             'interval': interval_minutes,
-            'next_run': job.next_run_time
+            'next_run': job.next_run_time,
+            'incremental': incremental,
+            'transport': transport,
+            'execution': execution
         }
         
         return job_id
@@ -393,6 +2117,7 @@ class ScraperScheduler:
         if job_id in self.jobs:
             self.scheduler.remove_job(job_id)
             del self.jobs[job_id]
+            self.delta_stores.pop(job_id, None)
             return True
         return False
     
@@ -406,6 +2131,117 @@ class ScraperScheduler:
 
 
 
+BROKERS = {
+    'sqlite': TaskQueue
+}
+
+
+def open_broker(location: str = 'mojo_queue.db') -> TaskBroker:
+    """Open a broker from 'scheme://address', or a plain path for the SQLite queue"""
+    scheme, sep, address = location.partition('://')
+    if not sep:
+        return TaskQueue(location)
+    if scheme not in BROKERS:
+        raise ValueError(f"Unknown broker '{scheme}' (available: {', '.join(BROKERS)})")
+    return BROKERS[scheme](address)
+
+
+def run_worker(queue_path: str = 'mojo_queue.db', history_path: str = 'mojo_history.db',
+               concurrency: int = 2, poll_interval: float = 2.0, lease_seconds: float = 300):
+    """Lease tasks from the queue and run them until interrupted"""
+    queue = open_broker(queue_path)
+    history = HistoryStore(history_path)
+    host_health = HostHealth()
+    base_id = f"{socket.gethostname()}:{os.getpid()}"
+    stop = threading.Event()
+    
+    def worker_loop(worker_id: str):
+        while not stop.is_set():
+            try:
+                queue.register_worker(worker_id)
+                task = queue.lease(worker_id, lease_seconds)
+            except sqlite3.Error as e:
+                # e.g. "database is locked" under contention - try again next poll
+                print(f"⚠ [{worker_id}] queue unavailable: {e}", flush=True)
+                stop.wait(poll_interval)
+                continue
+            if task is None:
+                stop.wait(poll_interval)
+                continue
+            
+            # Keep the lease alive while the scrape runs
+            done = threading.Event()
+            
+            def keep_alive():
+                while not done.wait(lease_seconds / 3):
+                    try:
+                        queue.heartbeat(task['id'], worker_id, lease_seconds)
+                        queue.register_worker(worker_id, task['id'])
+                    except sqlite3.Error as e:
+                        print(f"⚠ [{worker_id}] heartbeat for task {task['id']} failed: {e}", flush=True)
+            
+            threading.Thread(target=keep_alive, daemon=True).start()
+            try:
+                queue.register_worker(worker_id, task['id'])
+                result = run_scrape_task(task['job_id'], history=history, host_health=host_health,
+                                         **task['payload'])
+                queue.complete(task['id'], worker_id, result)
+                print(f"✓ [{worker_id}] task {task['id']} ({task['job_id']}) done: {result}", flush=True)
+            except Exception as e:
+                print(f"✗ [{worker_id}] task {task['id']} ({task['job_id']}) failed: {e}", flush=True)
+                try:
+                    queue.fail(task['id'], worker_id, str(e))
+                except sqlite3.Error as queue_error:
+                    # The lease expires on its own and the task is picked up again
+                    print(f"⚠ [{worker_id}] could not record failure of task {task['id']}: {queue_error}",
+                          flush=True)
+            finally:
+                done.set()
+    
+    threads = [
+        threading.Thread(target=worker_loop, args=(f"{base_id}-{i}",), daemon=True)
+        for i in range(max(1, concurrency))
+    ]
+    for thread in threads:
+        thread.start()
+    print(f"🐵 Worker {base_id} polling {queue_path} with {len(threads)} thread(s) "
+          f"(started in {STARTUP_SECONDS:.2f}s)", flush=True)
+    
+    try:
+        while any(thread.is_alive() for thread in threads):
+            time.sleep(1)
+    except KeyboardInterrupt:
+        stop.set()
+        for thread in threads:
+            thread.join()
+
+
+@process_resource
+def get_task_queue() -> TaskBroker:
+    """One task broker handle per server process (MOJO_BROKER picks another backend)"""
+    return open_broker(os.environ.get('MOJO_BROKER', 'mojo_queue.db'))
+
+
+@process_resource
+def get_history_store() -> HistoryStore:
+    """One history store per server process, shared by every session"""
+    return HistoryStore()
+
+
+@process_resource
+def get_transport_loop():
+    """One asyncio loop thread per process for the HTTP/2 transport, kept across reruns"""
+    loop = lazy_import('asyncio').new_event_loop()
+    threading.Thread(target=loop.run_forever, name='http2-transport', daemon=True).start()
+    return loop
+
+
+@process_resource
+def get_host_health() -> HostHealth:
+    """One circuit breaker registry per server process, kept across reruns and sessions"""
+    return HostHealth()
+
+
 def main():
     # Page configuration
     st.set_page_config(
@@ -440,10 +2276,22 @@ def main():
     # Initialize session state
     if 'scraped_data' not in st.session_state:
         st.session_state.scraped_data = None
+        SpillStore.collect_idle()
+    elif is_spilled(st.session_state.scraped_data) and not st.session_state.scraped_data.touch():
+        # Collected after sitting idle longer than SpillStore.IDLE_SECONDS
+        st.session_state.scraped_data = None
+        st.session_state.data_profile = None
+        st.session_state.preview_view = None
+        st.warning("⚠️ Your scraped data expired after being idle and was removed. Please scrape again.")
+    if 'data_profile' not in st.session_state:
+        st.session_state.data_profile = None
+    if 'preview_view' not in st.session_state:
+        st.session_state.preview_view = None
+    history = get_history_store()
+    host_health = get_host_health()
     if 'scheduler' not in st.session_state:
-        st.session_state.scheduler = ScraperScheduler()
-    if 'scraping_history' not in st.session_state:
-        st.session_state.scraping_history = []
+        # Created with the first job, so idle sessions don't start a scheduler thread
+        st.session_state.scheduler = None
     
     # Header
     st.markdown('<div class="main-header">🐵 MOJO the Scraper', unsafe_allow_html=True)
@@ -467,6 +2315,41 @@ def main():
             help="Enable this for websites that load content dynamically with JavaScript (slower)"
         )
         
+        # Infinite scroll / "load more" harvesting (browser only)
+        scroll_harvest = False
+        item_selector = None
+        load_more_selector = None
+        max_scroll_steps = 50
+        if use_selenium:
+            scroll_harvest = st.checkbox(
+                "♾️ Harvest infinite scroll",
+                value=False,
+                help="Keep scrolling (or clicking 'load more') and extract only the newly loaded items"
+            )
+            if scroll_harvest:
+                item_selector = st.text_input(
+                    "Item selector",
+                    placeholder="article.post, li.result",
+                    help="One element per feed item; the extraction method runs on new items only"
+                )
+                load_more_selector = st.text_input(
+                    "'Load more' button selector (optional)",
+                    placeholder="button.load-more"
+                ) or None
+                max_scroll_steps = st.number_input("Max scroll steps", min_value=1, max_value=1000, value=50)
+        
+        # Transport for static pages
+        transport = st.selectbox(
+            "🔌 Transport",
+            list(TRANSPORTS),
+            format_func=lambda t: {'requests': "requests (HTTP/1.1)", 'http2': "httpx (HTTP/2)"}[t],
+            disabled=use_selenium,
+            help="HTTP/2 shares one multiplexed connection per site - best for paginated crawls"
+        )
+        if transport == 'http2' and not HTTPX_AVAILABLE:
+            st.warning("⚠️ HTTP/2 needs httpx and h2: pip install 'httpx[http2]'")
+            transport = 'requests'
+        
         # Extraction method 
         st.subheader("📊 Extraction Method")
         extraction_method = st.selectbox(
@@ -477,8 +2360,9 @@ def main():
                 "Extract Images",
                 "Extract Text Content",
                 "Custom CSS Selector",
+                "Schema (Record Fields)",
                 "Meta Tags",
-                "Structured Data (JSON-LD)"
+                "Structured Data"
             ]
         )
         
@@ -497,6 +2381,27 @@ def main():
                 default=['text']
             )
         
+        # Schema mode: one container selector plus named field sub-selectors
+        schema_container = None
+        schema_fields = None
+        if extraction_method == "Schema (Record Fields)":
+            schema_container = st.text_input(
+                "Container Selector",
+                placeholder="div.product-card",
+                help="Each element matching this selector becomes one row"
+            )
+            schema_fields = st.text_area(
+                "Fields (JSON)",
+                value=json.dumps({
+                    "name": {"selector": "h2", "attr": "text"},
+                    "price": {"selector": ".price", "regex": r"([\d.,]+)"},
+                    "link": {"selector": "a", "attr": "href"},
+                    "image": {"selector": "img", "attr": "src"}
+                }, indent=2),
+                height=220,
+                help="Map column names to {selector, attr, regex}. Selectors are relative to the container."
+            )
+        
         # Text content tags
         text_tags = None
         if extraction_method == "Extract Text Content":
@@ -508,6 +2413,49 @@ def main():
         
         st.divider()
         
+        # Pagination
+        st.subheader("📑 Pagination")
+        paginate = st.checkbox(
+            "Follow pagination",
+            value=False,
+            help="Scrape every page of a listing and combine the results"
+        )
+        next_selector = None
+        url_template = None
+        start_page = 1
+        end_page = None
+        max_pages = 50
+        page_workers = 4
+        stop_when_no_new_rows = True
+        if paginate:
+            pagination_mode = st.radio(
+                "Find next page by:",
+                ["rel=next link", "Next-link selector", "URL template"]
+            )
+            if pagination_mode == "Next-link selector":
+                next_selector = st.text_input(
+                    "Next link selector",
+                    placeholder="a.next, li.pagination-next > a"
+                )
+            elif pagination_mode == "URL template":
+                url_template = st.text_input(
+                    "URL template",
+                    placeholder="https://example.com/list?page={page}",
+                    help="Use {page} where the page number goes"
+                )
+                start_page = st.number_input("First page", min_value=0, value=1)
+                end_page = st.number_input(
+                    "Last page (0 = unknown)",
+                    min_value=0,
+                    value=0,
+                    help="When the last page is known, pages are fetched concurrently"
+                ) or None
+                page_workers = st.slider("Concurrent fetches", min_value=1, max_value=16, value=4)
+            max_pages = st.number_input("Max pages", min_value=1, max_value=10000, value=50)
+            stop_when_no_new_rows = st.checkbox("Stop when a page has no new rows", value=True)
+        
+        st.divider()
+        
         # Data cleaning options
         st.subheader("🧹 Data Cleaning")
         clean_data = st.checkbox("Remove duplicates", value=True)
@@ -525,9 +2473,22 @@ def main():
             value=2,
             help="Add delay to avoid overwhelming the server"
         )
+        max_download_mb = st.number_input(
+            "Max page size (MB)",
+            min_value=1,
+            max_value=500,
+            value=AdvancedWebScraper.MAX_RESPONSE_BYTES // (1024 * 1024),
+            help="Downloads larger than this (after decompression) are aborted"
+        )
     
     # Main content area - Tabs
-    tab1, tab2, tab3, tab4 = st.tabs(["🔍 Scrape", "📅 Schedule", "📊 Data Analysis", "📚 History"])
+    tab_names = ["🔍 Scrape", "📅 Schedule", "📊 Data Analysis", "📚 History"]
+    try:
+        # Track the open tab so the analysis charts (and plotly) only load when viewed
+        tab1, tab2, tab3, tab4 = st.tabs(tab_names, key="main_tabs", on_change="rerun")
+    except TypeError:
+        # Older Streamlit renders every tab on each run
+        tab1, tab2, tab3, tab4 = st.tabs(tab_names)
     
     # TAB 1: Scraping
     with tab1:
@@ -540,7 +2501,10 @@ def main():
             if st.session_state.scraped_data is not None:
                 clear_button = st.button("🗑️ Clear Data", use_container_width=True)
                 if clear_button:
+                    SpillStore.release(st.session_state.scraped_data)
                     st.session_state.scraped_data = None
+                    st.session_state.data_profile = None
+                    st.session_state.preview_view = None
                     st.rerun()
         
         # Scraping logic
@@ -551,17 +2515,77 @@ def main():
                     time.sleep(delay)
                 
                 # Initialize scraper
-                scraper = AdvancedWebScraper(url, use_selenium=use_selenium)
+                scraper = AdvancedWebScraper(url, use_selenium=use_selenium,
+                                             max_bytes=int(max_download_mb) * 1024 * 1024,
+                                             transport=transport,
+                                             host_health=host_health)
                 
-                # Fetch page
-                if scraper.fetch_page():
-                    st.success("✅ Page fetched successfully!")
+                # Fetch page (scroll harvesting drives its own browser session,
+                # and a URL template names every page itself)
+                harvesting = scroll_harvest and item_selector
+                templated = paginate and url_template
+                if harvesting or templated or scraper.fetch_page():
+                    if not (harvesting or templated):
+                        st.success("✅ Page fetched successfully!")
                     
                     # Extract data based on method
                     df = None
                     
                     try:
-                        if extraction_method == "Auto-detect Tables":
+                        if paginate or harvesting:
+                            fields = None
+                            if extraction_method == "Schema (Record Fields)":
+                                fields = json.loads(schema_fields)
+                            
+                            def page_extractor(page_scraper):
+                                return extract_by_method(
+                                    page_scraper, extraction_method,
+                                    custom_selector=custom_selector,
+                                    custom_attrs=custom_attrs,
+                                    text_tags=text_tags,
+                                    schema_container=schema_container,
+                                    schema_fields=fields
+                                )
+                        
+                        if harvesting:
+                            df = scraper.harvest_scroll(
+                                page_extractor,
+                                item_selector,
+                                load_more_selector=load_more_selector,
+                                max_steps=int(max_scroll_steps)
+                            )
+                            if scraper.last_error:
+                                st.warning(f"⚠️ Harvest stopped early with {len(df)} rows: {scraper.last_error}")
+                            else:
+                                st.success(f"✅ Harvested {len(df)} rows")
+                        
+                        elif paginate:
+                            df = scraper.scrape_paginated(
+                                page_extractor,
+                                stop_when_no_new_rows=stop_when_no_new_rows,
+                                next_selector=next_selector,
+                                url_template=url_template,
+                                start_page=int(start_page),
+                                end_page=int(end_page) if end_page else None,
+                                max_pages=int(max_pages),
+                                max_workers=page_workers,
+                                delay=delay
+                            )
+                            pages = df['source_url'].nunique() if not df.empty else 0
+                            if scraper.failed_pages:
+                                st.warning(
+                                    f"⚠️ Extracted {len(df)} rows from {pages} page(s); "
+                                    f"{len(scraper.failed_pages)} page(s) could not be fetched"
+                                )
+                                with st.expander("Failed pages"):
+                                    st.dataframe(
+                                        pd.DataFrame(scraper.failed_pages, columns=['url', 'error']),
+                                        use_container_width=True
+                                    )
+                            else:
+                                st.success(f"✅ Extracted {len(df)} rows from {pages} page(s)")
+                        
+                        elif extraction_method == "Auto-detect Tables":
                             tables = scraper.extract_tables()
                             if tables:
                                 if len(tables) > 1:
@@ -608,19 +2632,28 @@ def main():
                             df = scraper.extract_custom_selector(custom_selector, custom_attrs)
                             st.success(f"✅ Extracted {len(df)} elements")
                         
+                        elif extraction_method == "Schema (Record Fields)" and schema_container:
+                            try:
+                                fields = json.loads(schema_fields)
+                            except json.JSONDecodeError as e:
+                                fields = None
+                                st.error(f"❌ Invalid fields JSON: {e}")
+                            if fields:
+                                df = scraper.extract_schema(schema_container, fields)
+                                st.success(f"✅ Extracted {len(df)} records")
+                        
                         elif extraction_method == "Meta Tags":
                             df = scraper.extract_meta_data()
                             st.success(f"✅ Extracted {len(df)} meta tags")
                         
-                        elif extraction_method == "Structured Data (JSON-LD)":
+                        elif extraction_method == "Structured Data":
                             structured = scraper.extract_structured_data()
-                            if structured:
-                                st.json(structured)
-                                # Convert to DataFrame if possible
-                                try:
-                                    df = pd.json_normalize(structured)
-                                except:
-                                    st.info("Structured data displayed above. Cannot convert to table format.")
+                            df = structured_to_frame(structured)
+                            if not df.empty:
+                                with st.expander("Raw structured data"):
+                                    st.json(structured)
+                                counts = df['@format'].value_counts()
+                                st.success("✅ Found " + ", ".join(f"{n} {fmt}" for fmt, n in counts.items()))
                             else:
                                 st.warning("⚠️ No structured data found")
                         
@@ -637,22 +2670,25 @@ def main():
                             if auto_convert_types:
                                 df = processor.detect_column_types(df)
                             
-                            # Store in session state
-                            st.session_state.scraped_data = df
+                            # Store in session state (large results are spilled to disk)
+                            SpillStore.release(st.session_state.scraped_data)
+                            st.session_state.scraped_data = SpillStore.store(df)
+                            st.session_state.data_profile = None
+                            st.session_state.preview_view = None
                             
                             # Add to history
-                            st.session_state.scraping_history.append({
-                                'timestamp': datetime.now(),
-                                'url': url,
-                                'method': extraction_method,
-                                'rows': len(df),
-                                'columns': len(df.columns)
-                            })
+                            history.record(
+                                url, extraction_method,
+                                rows=len(df),
+                                columns=len(df.columns)
+                            )
                             
                     except Exception as e:
                         st.error(f"❌ Error during extraction: {e}")
                 else:
                     st.error("❌ Failed to fetch the page")
+                
+                scraper.close()
         
         elif scrape_button and not url:
             st.warning("⚠️ Please enter a URL")
@@ -671,12 +2707,51 @@ def main():
             with col2:
                 st.metric("Columns", len(df.columns))
             with col3:
-                st.metric("Missing Values", df.isnull().sum().sum())
+                st.metric("Missing Values", DataProcessor.count_missing(df))
+            with col4:
+                st.metric("Memory", DataProcessor.memory_label(df))
+            
+            # Data preview - only the current page is sent to the browser
+            col1, col2, col3, col4 = st.columns([2, 2, 2, 1])
+            with col1:
+                filter_column = st.selectbox("Filter column", [None] + list(df.columns),
+                                             format_func=lambda c: "(none)" if c is None else str(c))
+            with col2:
+                filter_text = st.text_input("Contains", disabled=filter_column is None)
+            with col3:
+                sort_by = st.selectbox("Sort by", [None] + list(df.columns),
+                                       format_func=lambda c: "(none)" if c is None else str(c))
             with col4:
-                st.metric("Memory", f"{df.memory_usage(deep=True).sum() / 1024:.1f} KB")
+                descending = st.checkbox("Descending", disabled=sort_by is None)
+            
+            # Filter/sort order is cached until the data or the view settings change
+            view_key = (filter_column, filter_text, sort_by, descending)
+            view = st.session_state.preview_view
+            if view is None or view['key'] != view_key:
+                view = {
+                    'key': view_key,
+                    'positions': DataProcessor.view_positions(
+                        df, sort_by=sort_by, ascending=not descending,
+                        filter_column=filter_column, filter_text=filter_text
+                    )
+                }
+                st.session_state.preview_view = view
+            positions = view['positions']
+            
+            col1, col2 = st.columns([1, 3])
+            with col1:
+                page_size = st.selectbox("Rows per page", [50, 100, 500, 1000], index=1)
+            total_pages = max((len(positions) + page_size - 1) // page_size, 1)
+            with col2:
+                if st.session_state.get('preview_page', 1) > total_pages:
+                    st.session_state.preview_page = total_pages
+                page = st.number_input("Page", min_value=1, max_value=total_pages, key="preview_page")
             
-            # Data preview
-            st.dataframe(df, use_container_width=True, height=400)
+            page_df = DataProcessor.get_page(df, positions, page, page_size)
+            st.dataframe(page_df, use_container_width=True, height=400)
+            first_row = (page - 1) * page_size
+            st.caption(f"Rows {first_row + min(len(page_df), 1):,}–{first_row + len(page_df):,} of {len(positions):,}"
+                       + (f" (filtered from {len(df):,})" if len(positions) != len(df) else ""))
             
             # Download options
             st.divider()
@@ -686,31 +2761,29 @@ def main():
             
             processor = DataProcessor()
             
+            # Files are only built when a button is clicked, not on every rerun
             with col1:
-                csv_data = processor.export_to_csv(df)
                 st.download_button(
                     label="📄 Download CSV",
-                    data=csv_data,
+                    data=functools.partial(processor.export_to_csv, df),
                     file_name=f"scraped_data_{datetime.now().strftime('%Y%m%d_%H%M%S')}.csv",
                     mime="text/csv",
                     use_container_width=True
                 )
             
             with col2:
-                excel_data = processor.export_to_excel(df)
                 st.download_button(
                     label="📊 Download Excel",
-                    data=excel_data,
+                    data=functools.partial(processor.export_to_excel, df),
                     file_name=f"scraped_data_{datetime.now().strftime('%Y%m%d_%H%M%S')}.xlsx",
                     mime="application/vnd.openxmlformats-officedocument.spreadsheetml.sheet",
                     use_container_width=True
                 )
             
             with col3:
-                json_data = processor.export_to_json(df)
                 st.download_button(
                     label="📋 Download JSON",
-                    data=json_data,
+                    data=functools.partial(processor.export_to_json, df),
                     file_name=f"scraped_data_{datetime.now().strftime('%Y%m%d_%H%M%S')}.json",
                     mime="application/json",
                     use_container_width=True
@@ -719,8 +2792,13 @@ def main():
             with col4:
                 # Copy to clipboard button
                 if st.button("📋 Copy to Clipboard", use_container_width=True):
-                    st.code(df.to_csv(index=False), language="csv")
-                    st.info("👆 Data displayed above - copy manually")
+                    clip_rows = DataProcessor.CLIPBOARD_MAX_ROWS
+                    clip_df = DataProcessor.get_page(df, positions, 1, clip_rows)
+                    st.code(clip_df.to_csv(index=False), language="csv")
+                    if len(positions) > clip_rows:
+                        st.info(f"👆 First {clip_rows:,} of {len(positions):,} rows shown - download the file for everything")
+                    else:
+                        st.info("👆 Data displayed above - copy manually")
     
     # TAB 2: Scheduling
     with tab2:
@@ -753,15 +2831,51 @@ def main():
                 key="schedule_selenium"
             )
             
+            schedule_transport = st.selectbox(
+                "Transport",
+                [t for t in TRANSPORTS if t != 'http2' or HTTPX_AVAILABLE],
+                key="schedule_transport"
+            )
+            
+            schedule_execution = st.radio(
+                "Run jobs in",
+                ['local', 'queue'],
+                format_func=lambda e: {'local': "This app", 'queue': "Worker queue"}[e],
+                horizontal=True,
+                help="Queue mode only enqueues tasks; start workers with `python mojo.py worker`"
+            )
+            
+            schedule_incremental = st.checkbox(
+                "Only store changes (delta log)",
+                value=False,
+                help="Record added, removed and changed rows per run instead of a full file"
+            )
+            schedule_keys = ""
+            if schedule_incremental:
+                schedule_keys = st.text_input(
+                    "Key columns (comma separated)",
+                    placeholder="sku, name",
+                    help="Columns identifying a row. Leave empty to key on the whole row."
+                )
+            
             if st.button("➕ Add Scheduled Job", type="primary"):
                 if schedule_url:
-                    job_id = f"job_{len(st.session_state.scheduler.jobs) + 1}"
+                    if st.session_state.scheduler is None:
+                        st.session_state.scheduler = ScraperScheduler(
+                            history=history, queue=get_task_queue(), host_health=host_health
+                        )
+                    # Unique across sessions and restarts, since it names the job's delta log
+                    job_id = f"job_{uuid.uuid4().hex[:12]}"
                     st.session_state.scheduler.add_job(
                         job_id=job_id,
                         url=schedule_url,
                         interval_minutes=schedule_interval,
                         export_format=schedule_format,
-                        use_selenium=schedule_selenium
+                        use_selenium=schedule_selenium,
+                        incremental=schedule_incremental,
+                        transport=schedule_transport,
+                        execution=schedule_execution,
+                        key_columns=[col.strip() for col in schedule_keys.split(',') if col.strip()]
                     )
                     st.success(f"✅ Job '{job_id}' added successfully!")
                     st.rerun()
@@ -782,7 +2896,7 @@ def main():
         st.divider()
         st.subheader("📋 Active Scheduled Jobs")
         
-        jobs = st.session_state.scheduler.list_jobs()
+        jobs = st.session_state.scheduler.list_jobs() if st.session_state.scheduler is not None else {}
         
         if jobs:
             for job_id, job_info in jobs.items():
@@ -792,9 +2906,24 @@ def main():
                     with col1:
                         st.write(f"**URL:** {job_info['url']}")
                         st.write(f"**Interval:** {job_info['interval']} minutes")
+                        st.write(f"**Transport:** {job_info.get('transport', 'requests')}")
+                        st.write(f"**Runs in:** {'worker queue' if job_info.get('execution') == 'queue' else 'this app'}")
                     
                     with col2:
                         st.write(f"**Next Run:** {job_info['next_run']}")
+                        
+                        if job_info.get('incremental'):
+                            snapshot_date = st.date_input("Snapshot as of", key=f"snap_date_{job_id}")
+                            snapshot_time = st.time_input("Time", key=f"snap_time_{job_id}")
+                            if st.button("📦 Load snapshot", key=f"snapshot_{job_id}"):
+                                store = st.session_state.scheduler.delta_stores[job_id]
+                                SpillStore.release(st.session_state.scraped_data)
+                                st.session_state.scraped_data = SpillStore.store(store.snapshot(
+                                    datetime.combine(snapshot_date, snapshot_time)
+                                ))
+                                st.session_state.data_profile = None
+                                st.session_state.preview_view = None
+                                st.success("✅ Snapshot loaded into the Scrape tab")
                     
                     with col3:
                         if st.button("🗑️ Remove", key=f"remove_{job_id}"):
@@ -803,51 +2932,95 @@ def main():
                             st.rerun()
         else:
             st.info("No scheduled jobs yet. Add one above!")
+        
+        task_queue = get_task_queue()
+        queue_stats = task_queue.stats()
+        if queue_stats:
+            with st.expander("📬 Worker queue"):
+                col1, col2, col3, col4 = st.columns(4)
+                with col1:
+                    st.metric("Queued", queue_stats.get('queued', 0))
+                with col2:
+                    st.metric("Running", queue_stats.get('leased', 0))
+                with col3:
+                    st.metric("Done", queue_stats.get('done', 0))
+                with col4:
+                    st.metric("Failed", queue_stats.get('failed', 0))
+                
+                active_workers = task_queue.workers()
+                if active_workers.empty:
+                    st.warning("⚠️ No active workers. Start one with `python mojo.py worker`")
+                else:
+                    st.dataframe(active_workers, use_container_width=True, hide_index=True)
+        
+        host_summary = host_health.summary()
+        if not host_summary.empty:
+            with st.expander("🩺 Host health"):
+                st.dataframe(host_summary, use_container_width=True, hide_index=True)
     
     # TAB 3: Data Analysis
     with tab3:
-        if st.session_state.scraped_data is not None:
+        if st.session_state.scraped_data is not None and getattr(tab3, 'open', True):
             df = st.session_state.scraped_data
+            px = lazy_import('plotly.express')
+            go = lazy_import('plotly.graph_objects')
             
             st.subheader("📊 Data Analysis & Visualization")
             
+            # Profile is computed once per dataset and reused across reruns
+            if st.session_state.data_profile is None:
+                with st.spinner("Profiling data..."):
+                    st.session_state.data_profile = DataProcessor.profile_dataframe(df)
+            profile = st.session_state.data_profile
+            columns = profile['columns']
+            
+            if profile['sampled']:
+                st.caption(f"Top values estimated from a {DataProcessor.PROFILE_SAMPLE_ROWS:,}-row sample")
+            
             # Column statistics
             st.write("### Column Statistics")
             
-            numeric_cols = df.select_dtypes(include=['number']).columns.tolist()
+            numeric_cols = [col for col, info in columns.items() if info.get('kind') == 'numeric']
             
             if numeric_cols:
                 selected_col = st.selectbox("Select column to analyze:", numeric_cols)
+                stats = columns[selected_col]
                 
                 col1, col2, col3, col4 = st.columns(4)
                 
                 with col1:
-                    st.metric("Mean", f"{df[selected_col].mean():.2f}")
+                    st.metric("Mean", f"{stats['mean']:.2f}")
                 with col2:
-                    st.metric("Median", f"{df[selected_col].median():.2f}")
+                    st.metric("Median", f"{stats['median']:.2f}")
                 with col3:
-                    st.metric("Std Dev", f"{df[selected_col].std():.2f}")
+                    st.metric("Std Dev", f"{stats['std']:.2f}")
                 with col4:
-                    st.metric("Max", f"{df[selected_col].max():.2f}")
+                    st.metric("Max", f"{stats['max']:.2f}")
                 
-                # Histogram
-                fig = px.histogram(
-                    df,
-                    x=selected_col,
+                # Histogram from server-side bins
+                edges = stats['hist_edges']
+                fig = go.Figure(go.Bar(
+                    x=(edges[:-1] + edges[1:]) / 2,
+                    y=stats['hist_counts'],
+                    width=np.diff(edges)
+                ))
+                fig.update_layout(
                     title=f"Distribution of {selected_col}",
-                    nbins=30
+                    xaxis_title=str(selected_col),
+                    yaxis_title="count",
+                    bargap=0
                 )
                 st.plotly_chart(fig, use_container_width=True)
             
             # Value counts for categorical columns
             st.write("### Top Values in Columns")
             
-            categorical_cols = df.select_dtypes(include=['object']).columns.tolist()
+            categorical_cols = [col for col, info in columns.items() if info.get('kind') == 'categorical']
             
             if categorical_cols:
                 cat_col = st.selectbox("Select categorical column:", categorical_cols)
                 
-                value_counts = df[cat_col].value_counts().head(10)
+                value_counts = columns[cat_col]['top_values']
                 
                 fig = px.bar(
                     x=value_counts.index,
@@ -860,11 +3033,12 @@ def main():
             # Missing values heatmap
             st.write("### Missing Values Analysis")
             
-            missing_data = df.isnull().sum()
+            missing_data = pd.Series({col: info['nulls'] for col, info in columns.items()}, dtype=int)
+            total_rows = max(profile['rows'], 1)
             missing_df = pd.DataFrame({
                 'Column': missing_data.index,
                 'Missing Count': missing_data.values,
-                'Missing %': (missing_data.values / len(df) * 100).round(2)
+                'Missing %': (missing_data.values / total_rows * 100).round(2)
             })
             
             fig = px.bar(
@@ -880,8 +3054,9 @@ def main():
             # Data quality score
             st.write("### Data Quality Score")
             
-            completeness = (1 - df.isnull().sum().sum() / (len(df) * len(df.columns))) * 100
-            uniqueness = (df.nunique().sum() / (len(df) * len(df.columns))) * 100
+            cells = max(profile['rows'] * len(columns), 1)
+            completeness = (1 - missing_data.sum() / cells) * 100
+            uniqueness = min(sum(info['distinct'] for info in columns.values()) / cells * 100, 100)
             
             col1, col2 = st.columns(2)
             
@@ -915,15 +3090,53 @@ def main():
                 ))
                 st.plotly_chart(fig, use_container_width=True)
         
-        else:
+        elif st.session_state.scraped_data is None:
             st.info("👆 Scrape some data first to see analysis!")
     
     # TAB 4: History
     with tab4:
         st.subheader("📚 Scraping History")
         
-        if st.session_state.scraping_history:
-            history_df = pd.DataFrame(st.session_state.scraping_history)
+        totals = history.totals()
+        
+        if totals['runs']:
+            # Statistics come from precomputed aggregates
+            col1, col2, col3 = st.columns(3)
+            
+            with col1:
+                st.metric("Total Scrapes", f"{totals['runs']:,}")
+            with col2:
+                st.metric("Total Rows Scraped", f"{totals['rows']:,}")
+            with col3:
+                st.metric("Unique URLs", f"{totals['urls']:,}")
+            
+            st.divider()
+            
+            col1, col2, col3 = st.columns(3)
+            with col1:
+                history_method = st.selectbox("Method", [None] + history.distinct_methods(),
+                                              format_func=lambda m: "All" if m is None else m)
+            with col2:
+                history_source = st.selectbox("Source", [None, 'interactive', 'scheduled'],
+                                              format_func=lambda m: "All" if m is None else m.title())
+            with col3:
+                history_url = st.text_input("Exact URL", key="history_url")
+            
+            matching = history.count(url=history_url, method=history_method, source=history_source)
+            history_pages = max((matching + 99) // 100, 1)
+            
+            # One (timestamp, id) cursor per page visited; filters start over at page 1
+            history_filters = (history_url, history_method, history_source)
+            if st.session_state.get('history_filters') != history_filters:
+                st.session_state.history_filters = history_filters
+                st.session_state.history_cursors = [None]
+            history_cursors = st.session_state.history_cursors
+            history_page = len(history_cursors)
+            
+            history_df, next_cursor = history.query(
+                page_size=100, url=history_url, method=history_method, source=history_source,
+                after=history_cursors[-1]
+            )
             
             st.dataframe(
                 history_df,
@@ -936,25 +3149,36 @@ def main():
                     'url': st.column_config.TextColumn('URL', width='large'),
                     'method': 'Extraction Method',
                     'rows': st.column_config.NumberColumn('Rows', format="%d"),
-                    'columns': st.column_config.NumberColumn('Columns', format="%d")
+                    'columns': st.column_config.NumberColumn('Columns', format="%d"),
+                    'source': 'Source',
+                    'job_id': 'Job',
+                    'status': 'Status'
                 }
             )
-            
-            # Statistics
-            st.divider()
-            col1, col2, col3 = st.columns(3)
-            
+            col1, col2, col3 = st.columns([1, 1, 4])
             with col1:
-                st.metric("Total Scrapes", len(history_df))
+                st.button("⬅️ Newer", disabled=history_page == 1, key="history_newer",
+                          on_click=history_cursors.pop)
             with col2:
-                st.metric("Total Rows Scraped", history_df['rows'].sum())
+                st.button("Older ➡️", disabled=next_cursor is None, key="history_older",
+                          on_click=history_cursors.append, args=(next_cursor,))
             with col3:
-                st.metric("Unique URLs", history_df['url'].nunique())
+                st.caption(f"Page {history_page} of {history_pages} ({matching:,} matching runs)")
             
          
-            if st.button("🗑️ Clear History", type="secondary"):
-                st.session_state.scraping_history = []
-                st.rerun()
+            # History is shared by every session and scheduled job, so clearing needs confirming
+            confirm_clear = st.checkbox(
+                "I understand this deletes the history of every user and scheduled job",
+                key="confirm_clear_history"
+            )
+            
+            def clear_history():
+                history.clear()
+                st.session_state.confirm_clear_history = False
+                st.session_state.history_cursors = [None]
+            
+            st.button("🗑️ Clear History", type="secondary", disabled=not confirm_clear,
+                      on_click=clear_history)
         
         else:
             st.info("No scraping history yet. Start scraping to see history!")
@@ -969,8 +3193,35 @@ def main():
             
         </div>
     """, unsafe_allow_html=True)
+    
+    # Cold-start cost of this process: first module load plus anything imported lazily
+    st.caption(
+        f"⏱️ Loaded in {STARTUP_SECONDS * 1000:.0f} ms"
+        + "".join(f" · {name} {seconds * 1000:.0f} ms" for name, seconds in IMPORT_TIMINGS.items())
+    )
+
+
+
+@process_resource
+def get_startup_seconds(_measured: float) -> float:
+    """Module load time of the first run in this process (reruns don't re-import anything)"""
+    return _measured
+
 
+# Module load time, including the eager imports above
+STARTUP_SECONDS = get_startup_seconds(time.perf_counter() - _LOAD_STARTED)
 
 
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    # `python mojo.py worker` runs a queue worker instead of the app
+    if len(sys.argv) > 1 and sys.argv[1] == 'worker':
+        parser = argparse.ArgumentParser(prog='mojo.py worker', description='Run scrape tasks from the queue')
+        parser.add_argument('--queue', default=os.environ.get('MOJO_BROKER', 'mojo_queue.db'),
+                            help='Broker as scheme://address, or a path to the SQLite queue')
+        parser.add_argument('--history', default='mojo_history.db', help='Path to the history database')
+        parser.add_argument('--concurrency', type=int, default=2, help='Tasks to run at once')
+        parser.add_argument('--poll', type=float, default=2.0, help='Seconds between polls when idle')
+        args = parser.parse_args(sys.argv[2:])
+        run_worker(args.queue, args.history, args.concurrency, args.poll)
+    else:
+        main()
\ No newline at end of file